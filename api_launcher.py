@@ -1,11 +1,16 @@
 #!/usr/bin/env python3
 import sys
 import os
+import atexit
+import queue
+import time
 import logging
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 import uvicorn
 
-sys.path.insert(0, str(Path(__file__).parent))
+_HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(_HERE))
 
 from moondream_station.core.config import ConfigManager
 from moondream_station.core.manifest import ManifestManager
@@ -13,18 +18,41 @@ from moondream_station.core.rest_server import RestServer
 from moondream_station.core.analytics import Analytics
 from moondream_station.session import SessionState
 
+class SecondCachingFormatter(logging.Formatter):
+    """Formatter that only re-runs strftime when the wall-clock second changes"""
+
+    _cached_second = None
+    _cached_time = ""
+
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_second = second
+            self._cached_time = super().formatTime(record, datefmt)
+        return self._cached_time
+
+
 # Configure logging for shutdown monitor visibility
+# Records are queued and written by a background listener so logging
+# never blocks the server's event loop on stream I/O
 log_level = os.getenv("LOG_LEVEL", "INFO").upper()
-logging.basicConfig(
-    level=getattr(logging, log_level, logging.INFO),
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+log_handler = logging.StreamHandler()
+log_handler.setFormatter(SecondCachingFormatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     datefmt='%Y-%m-%d %H:%M:%S'
-)
+))
+log_queue = queue.SimpleQueue()
+log_listener = QueueListener(log_queue, log_handler, respect_handler_level=True)
+root_logger = logging.getLogger()
+root_logger.setLevel(getattr(logging, log_level, logging.INFO))
+root_logger.addHandler(QueueHandler(log_queue))
+log_listener.start()
+atexit.register(log_listener.stop)
 
 # Initialize
 config = ConfigManager()
 manifest_manager = ManifestManager(config)
-manifest_manager.load_manifest("./local_manifest.json")
+manifest_manager.load_manifest(str(_HERE / "local_manifest.json"))
 
 # Get default model
 model_name = manifest_manager.get_available_default_model()
@@ -47,6 +75,14 @@ if os.getenv("SHUTDOWN_TIMEOUT"):
     except ValueError:
         print(f"Warning: Invalid SHUTDOWN_TIMEOUT value, using default")
 
+# INFERENCE_WORKERS: model replicas serving requests in parallel (default: 1).
+# Each worker loads its own copy of the model, so raise it only when memory allows.
+if os.getenv("INFERENCE_WORKERS"):
+    try:
+        config.set("inference_workers", max(1, int(os.getenv("INFERENCE_WORKERS"))))
+    except ValueError:
+        print(f"Warning: Invalid INFERENCE_WORKERS value, using default")
+
 # Setup server
 analytics = Analytics(config, manifest_manager)
 session_state = SessionState()
@@ -65,5 +101,11 @@ model_service = get_model_service()
 print(f"Model loaded: {model_service.model_name}")
 print(f"Device: {model_service.device}")
 
+if hasattr(model_service, "warmup"):
+    print("Warming up model...")
+    warmup_start = time.monotonic()
+    model_service.warmup()
+    print(f"Warmup done in {time.monotonic() - warmup_start:.1f}s")
+
 # Run FastAPI directly with uvicorn
 uvicorn.run(server.app, host="0.0.0.0", port=2020, log_level="info")
@@ -2,7 +2,7 @@ import torch
 from transformers import AutoModelForCausalLM, AutoTokenizer
 from PIL import Image
 import logging
-import base64
+import binascii
 import io
 from typing import List, Optional
 
@@ -29,6 +29,24 @@ def get_model_service():
     return _model_service
 
 
+def _inference_mode_tokens(tokens):
+    # A generator body runs outside the caller's context manager, so
+    # re-enter inference mode for every decode step
+    while True:
+        with torch.inference_mode():
+            try:
+                token = next(tokens)
+            except StopIteration:
+                return
+        yield token
+
+
+def _stream_in_inference_mode(result: dict, key: str) -> dict:
+    if key in result:
+        result[key] = _inference_mode_tokens(iter(result[key]))
+    return result
+
+
 class ModelService:
     def __init__(self, model_name: str, revision: str):
         self.model_name = model_name
@@ -36,7 +54,10 @@ class ModelService:
         self.device = self._get_best_device()
 
         self.model = AutoModelForCausalLM.from_pretrained(
-            model_name, revision=revision, trust_remote_code=True, dtype=torch.bfloat16
+            model_name,
+            revision=revision,
+            trust_remote_code=True,
+            dtype=self._get_best_dtype(self.device),
         )
 
         self.model.compile()
@@ -58,6 +79,16 @@ class ModelService:
         else:
             return "cpu"
 
+    @staticmethod
+    def _get_best_dtype(device: str) -> torch.dtype:
+        # Pre-Ampere CUDA cards only emulate bf16; use fp16 there instead
+        if device == "cuda" and not torch.cuda.is_bf16_supported(
+            including_emulation=False
+        ):
+            return torch.float16
+        return torch.bfloat16
+
+    @torch.inference_mode()
     def caption(
         self,
         image: Image.Image,
@@ -67,10 +98,12 @@ class ModelService:
         variant: str = None,
     ) -> dict:
         settings["variant"] = variant
-        return self.model.caption(
+        result = self.model.caption(
             image, length=length, stream=stream, settings=settings
         )
+        return _stream_in_inference_mode(result, "caption") if stream else result
 
+    @torch.inference_mode()
     def query(
         self,
         image: Image.Image,
@@ -81,10 +114,12 @@ class ModelService:
         reasoning: bool = False,
     ) -> dict:
         settings["variant"] = variant
-        return self.model.query(
+        result = self.model.query(
             image, question, stream=stream, settings=settings, reasoning=reasoning
         )
+        return _stream_in_inference_mode(result, "answer") if stream else result
 
+    @torch.inference_mode()
     def detect(
         self,
         image: Image.Image,
@@ -95,16 +130,25 @@ class ModelService:
         settings["variant"] = variant
         return self.model.detect(image, obj, settings)
 
+    @torch.inference_mode()
     def point(
         self, image: Image.Image, obj: str, settings: dict = {}, variant=None
     ) -> dict:
         settings["variant"] = variant
         return self.model.point(image, obj, settings)
 
+    @torch.inference_mode()
+    def warmup(self):
+        """Run one tiny caption so compilation and kernel autotuning happen
+        before the first real request"""
+        image = Image.new("RGB", (64, 64))
+        self.model.caption(image, length="short")
+
     def count_tokens(self, text: str) -> int:
         """Count tokens in text using the model's tokenizer"""
         return len(self.model.tokenizer.encode(text))
 
+    @torch.inference_mode()
     def encode_image(self, image: Image.Image):
         """Return an encoded representation of the image if supported by the model."""
         if hasattr(self.model, "encode_image"):
@@ -112,13 +156,49 @@ class ModelService:
         return None
 
 
+MAX_IMAGE_BYTES = 32 * 1024 * 1024
+# Decompression-bomb guard; PIL raises past twice this many pixels
+Image.MAX_IMAGE_PIXELS = 64 * 1024 * 1024
+
+# Magic numbers for the formats clients actually send
+_IMAGE_SIGNATURES = (
+    (b"\xff\xd8\xff", "JPEG"),
+    (b"\x89PNG\r\n\x1a\n", "PNG"),
+    (b"GIF8", "GIF"),
+)
+
+
+def _sniff_image_format(raw_bytes: bytes) -> Optional[str]:
+    for signature, image_format in _IMAGE_SIGNATURES:
+        if raw_bytes.startswith(signature):
+            return image_format
+    if raw_bytes[:4] == b"RIFF" and raw_bytes[8:12] == b"WEBP":
+        return "WEBP"
+    return None
+
+
 def _load_base64_image(image_url: str) -> Image.Image:
+    encoded = image_url
     if image_url.startswith("data:image"):
-        _, encoded = image_url.split(",", 1)
-    else:
-        encoded = image_url
-    raw_bytes = base64.b64decode(encoded)
-    image = Image.open(io.BytesIO(raw_bytes)).convert("RGB")
+        # The comma ends the short media-type header; don't scan the payload
+        comma = image_url.find(",", 0, 256)
+        if comma == -1:
+            raise ValueError("Malformed data URL")
+        encoded = image_url[comma + 1:]
+    if len(encoded) * 3 // 4 > MAX_IMAGE_BYTES:
+        raise ValueError("Image too large")
+
+    # Same lenient decode as base64.b64decode, minus its str->bytes copy
+    raw_bytes = binascii.a2b_base64(encoded)
+
+    # Go straight to the right decoder instead of probing every PIL plugin
+    image_format = _sniff_image_format(raw_bytes)
+    formats = [image_format] if image_format else None
+    image = Image.open(io.BytesIO(raw_bytes), formats=formats)
+    if image.mode != "RGB":
+        return image.convert("RGB")
+    # convert() would have decoded the pixels; keep decode errors surfacing here
+    image.load()
     return image
 
 
@@ -257,7 +337,8 @@ def batch_detect(
         for idx, phrase in enumerate(targets):
             try:
                 if encoded_image is not None and hasattr(service.model, "detect"):
-                    det = service.model.detect(encoded_image, phrase, settings=settings or {})
+                    with torch.inference_mode():
+                        det = service.model.detect(encoded_image, phrase, settings=settings or {})
                 else:
                     det = service.detect(image, phrase, settings=settings or {})
 
@@ -1,11 +1,9 @@
+import sys
 import typer
 from typing import Optional
 from rich import print as rprint
 
-from .repl import REPLSession
-
-
-DEFAULT_MANIFEST_URL = "https://m87-md-prod-assets.s3.us-west-2.amazonaws.com/station/mds2/production_manifest.json"
+from .core.config import DEFAULT_MANIFEST_URL
 
 
 app = typer.Typer(
@@ -16,6 +14,14 @@ app = typer.Typer(
 )
 
 
+def _start_repl(manifest: Optional[str]):
+    # The REPL pulls in the whole service stack; `--version` shouldn't pay for it
+    from .repl import REPLSession
+
+    session = REPLSession(manifest_source=manifest)
+    session.start()
+
+
 @app.command()
 def interactive(
     manifest: Optional[str] = typer.Option(
@@ -23,8 +29,7 @@ def interactive(
     )
 ):
     """Start interactive REPL mode (default)"""
-    session = REPLSession(manifest_source=manifest)
-    session.start()
+    _start_repl(manifest)
 
 
 @app.callback(invoke_without_command=True)
@@ -43,9 +48,12 @@ def main(
         raise typer.Exit()
 
     if ctx.invoked_subcommand is None:
-        session = REPLSession(manifest_source=manifest)
-        session.start()
+        _start_repl(manifest)
 
 
 if __name__ == "__main__":
-    app()
+    if len(sys.argv) == 1:
+        # Bare launch is the common case; skip building typer's click command
+        _start_repl(DEFAULT_MANIFEST_URL)
+    else:
+        app()
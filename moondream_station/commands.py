@@ -3,7 +3,6 @@ import shutil
 from pathlib import Path
 from rich import print as rprint
 from rich.panel import Panel
-from rich.markdown import Markdown
 
 from moondream_station.core.config import (
     SERVICE_PORT,
@@ -13,6 +12,43 @@ from moondream_station.core.config import (
 )
 from moondream_station.core.manual import ManualManager
 
+# Config keys `settings set` accepts, and the subset that needs a service restart
+SETTABLE_PARAMS = frozenset(
+    {"inference_workers", "inference_max_queue_size", "inference_timeout", "logging"}
+)
+RESTART_PARAMS = frozenset(
+    {"inference_workers", "inference_max_queue_size", "inference_timeout"}
+)
+
+HELP_TEXT = """\
+[bold blue]Model Management:[/bold blue]
+  [bold]models[/bold]                       List available models
+  [bold]models switch <name>[/bold]         Switch to model
+
+[bold blue]Service Control:[/bold blue]
+  [bold]start[/bold] \\[port]                 Start REST server
+  [bold]stop[/bold]                         Stop REST server
+  [bold]restart[/bold]                      Restart server
+
+[bold blue]Inference:[/bold blue]
+  [bold]inference[/bold]                    Enter inference mode
+  [bold]infer <function> <image>[/bold]     Run inference
+
+[bold blue]Configuration:[/bold blue]
+  [bold]settings[/bold]                     Show status, config & manifest
+  [bold]settings set <key> <value>[/bold]   Update setting
+
+[bold blue]Other:[/bold blue]
+  [bold]update[/bold]                       Check for updates
+  [bold]session[/bold]                      Session monitoring
+  [bold]history[/bold]                      Command history
+  [bold]manual[/bold] (man)                 Display user manual
+  [bold]reset[/bold]                        Reset app data & settings
+  [bold]help[/bold]                         Show this help
+  [bold]exit[/bold]                         Exit
+
+[dim]Ctrl+C or type 'exit' to quit, Ctrl+D to clear text.[/dim]"""
+
 
 class CommandHandlers:
     def __init__(self, repl_session):
@@ -187,7 +223,7 @@ class CommandHandlers:
             try:
                 with self.repl.display.spinner("Updating manifest"):
                     self.repl.manifest_manager.load_manifest(
-                        last_manifest_source, self.repl.analytics, self.repl.display
+                        last_manifest_source, self.repl.analytics
                     )
             except Exception as e:
                 self.repl.analytics.track_error(
@@ -228,16 +264,9 @@ class CommandHandlers:
             key = args[1]
             value = " ".join(args[2:])
 
-            settable_params = {
-                "inference_workers",
-                "inference_max_queue_size",
-                "inference_timeout",
-                "logging",
-            }
-
-            if key not in settable_params:
+            if key not in SETTABLE_PARAMS:
                 self.repl.display.error(
-                    f"Cannot set '{key}'. Settable parameters: {', '.join(sorted(settable_params))}"
+                    f"Cannot set '{key}'. Settable parameters: {', '.join(sorted(SETTABLE_PARAMS))}"
                 )
                 return
 
@@ -260,12 +289,7 @@ class CommandHandlers:
             self.repl.display.success(f"Set {key} = {value}")
 
             # Restart service if it's running and an inference setting changed
-            inference_settings = {
-                "inference_workers",
-                "inference_max_queue_size",
-                "inference_timeout",
-            }
-            if key in inference_settings and self.repl.service.is_running():
+            if key in RESTART_PARAMS and self.repl.service.is_running():
                 self.repl.analytics.track(
                     "settings_auto_restart", {"setting": key, "new_value": str(value)}
                 )
@@ -307,16 +331,9 @@ class CommandHandlers:
             ("service_host", "Host"),
         ]
 
-        settable_params = {
-            "inference_workers",
-            "inference_max_queue_size",
-            "inference_timeout",
-            "logging",
-        }
-
         for key, display_name in service_settings:
             if key in config_data:
-                if key in settable_params:
+                if key in SETTABLE_PARAMS:
                     content.append(
                         f"  [bold][cyan]{display_name}[/cyan]:[/bold] {config_data[key]}"
                     )
@@ -335,7 +352,7 @@ class CommandHandlers:
 
         for key, display_name in inference_settings:
             if key in config_data:
-                if key in settable_params:
+                if key in SETTABLE_PARAMS:
                     content.append(
                         f"  [bold][cyan]{display_name}[/cyan]:[/bold] {config_data[key]}"
                     )
@@ -381,38 +398,8 @@ class CommandHandlers:
 
     def help(self, args: List[str]):
         """Show help information"""
-        help_text = """
-[bold blue]Model Management:[/bold blue]
-  [bold]models[/bold]                       List available models
-  [bold]models switch <name>[/bold]         Switch to model
-
-[bold blue]Service Control:[/bold blue]
-  [bold]start[/bold] \\[port]                 Start REST server
-  [bold]stop[/bold]                         Stop REST server
-  [bold]restart[/bold]                      Restart server
-
-[bold blue]Inference:[/bold blue]
-  [bold]inference[/bold]                    Enter inference mode
-  [bold]infer <function> <image>[/bold]     Run inference
-
-[bold blue]Configuration:[/bold blue]
-  [bold]settings[/bold]                     Show status, config & manifest
-  [bold]settings set <key> <value>[/bold]   Update setting
-
-[bold blue]Other:[/bold blue]
-  [bold]update[/bold]                       Check for updates
-  [bold]session[/bold]                      Session monitoring
-  [bold]history[/bold]                      Command history
-  [bold]manual[/bold] (man)                 Display user manual
-  [bold]reset[/bold]                        Reset app data & settings
-  [bold]help[/bold]                         Show this help
-  [bold]exit[/bold]                         Exit
-
-[dim]Ctrl+C or type 'exit' to quit, Ctrl+D to clear text.[/dim]
-        """
-
         panel = Panel(
-            help_text.strip(),
+            HELP_TEXT,
             title="[bold blue]Help[/bold blue]",
             border_style="blue",
             width=PANEL_WIDTH,
@@ -502,6 +489,9 @@ class CommandHandlers:
             manual_content = manual_manager.get_manual()
 
         if manual_content:
+            # rich.markdown pulls in markdown-it; only load it when the manual is shown
+            from rich.markdown import Markdown
+
             md = Markdown(manual_content)
             panel = Panel(
                 md,
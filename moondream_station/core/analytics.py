@@ -2,13 +2,35 @@ import uuid
 import platform
 import traceback
 import os
-from typing import Dict, Any, Optional
+import threading
+import time
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 
 import posthog
 import requests
 
 posthog.disabled = True  # Start disabled to prevent auto-uploads on import
 
+# Both base-model probes hit huggingface.co; share one keep-alive connection
+_SESSION = requests.Session()
+
+# How long a base-model probe result is trusted before track() re-probes
+BASE_MODEL_CHECK_TTL = 300.0
+
+# Fixed for the life of the process; resolve once rather than per event
+PLATFORM_PROPERTIES = {
+    "platform": platform.system(),
+    "python_version": platform.python_version(),
+}
+
+
+@lru_cache(maxsize=1)
+def _auth_headers(hf_token: str) -> Dict[str, str]:
+    # Only the gated-model probe carries the token; the public fallback
+    # must not, or an invalid token would turn its 200 into a 401
+    return {"Authorization": f"Bearer {hf_token}"}
+
 
 class Analytics:
     def __init__(self, config_manager, manifest_manager=None):
@@ -16,14 +38,60 @@ class Analytics:
         self.manifest_manager = manifest_manager
         self.client = None
         self.has_base_model = False
+        self._check_lock = threading.Lock()
+        self._check_inflight: Optional[threading.Event] = None
+        self._checked_at: Optional[float] = None
+        # Events held while a background initialization is still running
+        self._pending_lock = threading.Lock()
+        self._pending: Optional[List[Tuple[str, Optional[Dict[str, Any]]]]] = None
 
         if not self.config.get("user_id"):
             self.config.set("user_id", str(uuid.uuid4()))
 
         self._initialize_posthog()
 
+    def initialize_in_background(self):
+        """Run _initialize_posthog on a daemon thread, replaying events tracked meanwhile"""
+        with self._pending_lock:
+            self._pending = []
+        threading.Thread(target=self._initialize_and_replay, daemon=True).start()
+
+    def _initialize_and_replay(self):
+        try:
+            self._initialize_posthog()
+        finally:
+            with self._pending_lock:
+                pending, self._pending = self._pending, None
+            for event, properties in pending:
+                self.track(event, properties)
+
     def _check_base_model(self):
-        """Check if we can access the base model"""
+        """Check if we can access the base model, joining any check already in flight"""
+        checked_at = self._checked_at
+        if checked_at is not None and time.monotonic() - checked_at < BASE_MODEL_CHECK_TTL:
+            return
+
+        with self._check_lock:
+            inflight = self._check_inflight
+            is_owner = inflight is None
+            if is_owner:
+                inflight = self._check_inflight = threading.Event()
+
+        if not is_owner:
+            # Another caller is already probing; share its result
+            inflight.wait()
+            return
+
+        try:
+            self._probe_base_model()
+            self._checked_at = time.monotonic()
+        finally:
+            with self._check_lock:
+                self._check_inflight = None
+            inflight.set()
+
+    def _probe_base_model(self):
+        """Probe Hugging Face for base model access"""
         if not requests:
             self.has_base_model = False
             return
@@ -31,10 +99,9 @@ class Analytics:
         try:
             hf_token = os.environ.get("HF_TOKEN")
             if hf_token:
-                headers = {"Authorization": f"Bearer {hf_token}"}
-                response = requests.get(
+                response = _SESSION.get(
                     "https://huggingface.co/moondream/moondream3-preview/blob/main/config.json",
-                    headers=headers,
+                    headers=_auth_headers(hf_token),
                     timeout=2,
                 )
                 if response.status_code == 200:
@@ -42,16 +109,16 @@ class Analytics:
                     if self.has_base_model and self.client is None:
                         self._setup_posthog_client()
                     return
-        except:
+        except Exception:
             pass
 
         try:
-            response = requests.get(
+            response = _SESSION.get(
                 "https://huggingface.co/vikhyatk/moondream2/resolve/main/config.json",
                 timeout=2,
             )
             self.has_base_model = response.status_code == 200
-        except:
+        except Exception:
             self.has_base_model = False
 
         if self.has_base_model and self.client is None:
@@ -101,6 +168,12 @@ class Analytics:
         return None
 
     def track(self, event: str, properties: Optional[Dict[str, Any]] = None):
+        if self._pending is not None:
+            with self._pending_lock:
+                if self._pending is not None:
+                    self._pending.append((event, properties))
+                    return
+
         if not self.client or not self.config.get("logging", True):
             return
 
@@ -112,12 +185,7 @@ class Analytics:
         if properties is None:
             properties = {}
 
-        properties.update(
-            {
-                "platform": platform.system(),
-                "python_version": platform.python_version(),
-            }
-        )
+        properties.update(PLATFORM_PROPERTIES)
 
         try:
             self.client.capture(
@@ -147,13 +215,16 @@ class Analytics:
             },
         )
 
-    def track_error(self, error_type: str, error_msg: str, context: str = None):
+    def track_error(
+        self, error_type: str, error_msg: str, context: str = None, tb: str = None
+    ):
+        # Callers off the except block (e.g. on another thread) must pass tb
         self.track(
             "error",
             {
                 "error_type": error_type,
                 "error_message": error_msg,
                 "context": context,
-                "traceback": traceback.format_exc(),
+                "traceback": tb if tb is not None else traceback.format_exc(),
             },
         )
@@ -1,12 +1,15 @@
 import json
 import os
+import platform
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 
 SERVICE_PORT = 2020
 UPDATE_ENDPOINT = "https://api.github.com/repos/m87/moondream-station/releases/latest"
 SERVICE_HOST = "127.0.0.1"
+DEFAULT_MANIFEST_URL = "https://m87-md-prod-assets.s3.us-west-2.amazonaws.com/station/mds2/production_manifest.json"
 AUTO_START = True
 LOG_LEVEL = "INFO"
 INFERENCE_WORKERS = 1
@@ -17,27 +20,47 @@ INFERENCE_TIMEOUT = 30.0
 PANEL_WIDTH = 70
 PORT_SEARCH_RANGE = 20
 HISTORY_DISPLAY_LIMIT = 10
+SESSION_FLUSH_INTERVAL = 5.0
 
 # Network Constants
 NETWORK_TIMEOUT = 30
 DOWNLOAD_TIMEOUT = 60
+MAX_REQUEST_BYTES = 48 * 1024 * 1024  # ~32 MB image once base64-encoded
+
+# Installer Constants (skip pip's self-update check and interactive prompts)
+INSTALLER_ENV_OVERRIDES = {
+    "PIP_DISABLE_PIP_VERSION_CHECK": "1",
+    "PIP_NO_INPUT": "1",
+    "UV_NO_PROGRESS": "1",
+}
+
+
+@lru_cache(maxsize=1)
+def get_current_os() -> str:
+    """Lowercase OS name as used by the manifest's supported_os lists"""
+    return platform.system().lower()
+
+
+@lru_cache(maxsize=1)
+def get_app_dir() -> Path:
+    """Per-user data directory (~/.moondream-station)"""
+    return Path.home() / ".moondream-station"
 
 
 class ConfigManager:
     def __init__(self):
-        self.config_dir = Path.home() / ".moondream-station"
+        self.config_dir = get_app_dir()
         self.config_file = self.config_dir / "config.json"
         self.config_dir.mkdir(exist_ok=True)
         self._config = self._load_config()
 
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from file"""
-        if self.config_file.exists():
-            try:
-                with open(self.config_file) as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
-                pass
+        try:
+            with open(self.config_file) as f:
+                return json.load(f)
+        except (json.JSONDecodeError, IOError):
+            pass
 
         return self._get_default_config()
 
@@ -61,8 +84,11 @@ class ConfigManager:
     def _save_config(self):
         """Save configuration to file"""
         try:
-            with open(self.config_file, "w") as f:
+            # Replace atomically so a crash mid-write can't truncate the config
+            tmp_file = self.config_file.with_suffix(".tmp")
+            with open(tmp_file, "w") as f:
                 json.dump(self._config, f, indent=2)
+            os.replace(tmp_file, self.config_file)
         except IOError:
             pass
 
@@ -1,4 +1,5 @@
 import asyncio
+import queue
 
 from typing import Any, Dict, Optional
 
@@ -16,6 +17,9 @@ class InferenceService:
         self.worker_pool = None
         self.current_model = None
         self.worker_backends = []
+        # Requests admitted but not yet finished; only touched on the event loop
+        self._inflight = 0
+        self._max_inflight = 0
 
     def start(self, model_id: str):
         n_workers = int(self.config.get("inference_workers", N_WORKERS))
@@ -38,11 +42,15 @@ class InferenceService:
             return False
 
         self.worker_pool = SimpleWorkerPool(n_workers, max_queue_size, timeout)
+        self._max_inflight = n_workers + max_queue_size
         return True
 
     async def stop(self):
         if self.worker_pool:
-            self.worker_pool.shutdown()
+            # Shutdown doesn't join workers, but its sentinel put() can wait up to
+            # 1s per worker if new requests refill the queue; keep it off the loop
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self.worker_pool.shutdown)
             self.worker_pool = None
         self.worker_backends = []
         self.current_model = None
@@ -59,13 +67,29 @@ class InferenceService:
 
         func = getattr(backend, function_name)
 
-        loop = asyncio.get_event_loop()
-
-        def submit_with_kwargs():
-            return self.worker_pool.submit_request(func, timeout, **kwargs)
-
-        result = await loop.run_in_executor(None, submit_with_kwargs)
-        return result
+        # Reject on the event loop once every worker and queue slot is spoken
+        # for, instead of parking another executor thread just to be refused
+        if self._inflight >= self._max_inflight:
+            return {"error": "Queue is full", "status": "rejected"}
+
+        try:
+            future = self.worker_pool.submit(func, timeout, **kwargs)
+        except queue.Full:
+            return {"error": "Queue is full", "status": "rejected"}
+
+        # Await the worker's Future directly rather than blocking a thread on it
+        self._inflight += 1
+        try:
+            return await asyncio.wait_for(
+                asyncio.wrap_future(future),
+                timeout or self.worker_pool.default_timeout,
+            )
+        except asyncio.TimeoutError:
+            # wait_for cancelled the future, so a still-queued request is skipped
+            self.worker_pool.record_timeout()
+            return {"error": "Request timeout", "status": "timeout"}
+        finally:
+            self._inflight -= 1
 
     def _get_next_backend(self):
         if not self.worker_backends:
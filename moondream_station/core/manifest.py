@@ -1,19 +1,105 @@
+import hashlib
+import io
 import json
+import operator
+import os
 import requests
+import importlib.metadata
 import importlib.util
 import sys
 import subprocess
 import tarfile
 import shutil
-import tempfile
-import platform
+import re
 
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from pydantic import BaseModel
 from packaging.version import Version
-
-from .config import NETWORK_TIMEOUT, DOWNLOAD_TIMEOUT
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .config import (
+    NETWORK_TIMEOUT,
+    DOWNLOAD_TIMEOUT,
+    INSTALLER_ENV_OVERRIDES,
+    get_current_os,
+)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+STREAM_BUFFER_SIZE = 256 * 1024
+TAR_BUFFER_SIZE = 1024 * 1024
+# The name must end the line or be followed by extras, a specifier, a marker
+# or "@", so "git+https://..." and bare URLs don't match as "git"/"https"
+REQUIREMENT_NAME_RE = re.compile(r"[A-Za-z0-9][A-Za-z0-9._-]*(?=$|[\s\[<>=!~;@])")
+
+# Map of pip package names to import names
+PACKAGE_IMPORT_MAP = {
+    'pillow': 'PIL',
+    'pyyaml': 'yaml',
+    'pytorch': 'torch',
+    'tensorflow-cpu': 'tensorflow',
+    'tensorflow-gpu': 'tensorflow',
+    'scikit-learn': 'sklearn',
+    'beautifulsoup4': 'bs4',
+    'python-dateutil': 'dateutil',
+    'msgpack-python': 'msgpack',
+    'protobuf': 'google.protobuf',
+    'opencv-python': 'cv2',
+    'opencv-python-headless': 'cv2',
+    'python-dotenv': 'dotenv',
+    'typing-extensions': 'typing_extensions',
+}
+
+# Version message specs: "<1.2", ">1.2", "==1.2" or a bare version (exact match)
+VERSION_SPEC_RE = re.compile(r"(<|>|==)?\s*(.*?)\s*$")
+VERSION_SPEC_OPS = {
+    "<": operator.lt,
+    ">": operator.gt,
+    "==": operator.eq,
+    None: operator.eq,
+}
+
+# Shared session so manifest and backend downloads reuse keep-alive connections
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504]),
+)
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.mount("http://", _ADAPTER)
+
+
+def _backend_members(tar: tarfile.TarFile):
+    """Yield archive members, skipping stale bytecode that gets rebuilt on import"""
+    for member in tar:
+        parts = member.name.split("/")
+        if "__pycache__" in parts or member.name.endswith(".pyc"):
+            continue
+        yield member
+
+
+class _HashingReader:
+    """File-like wrapper that hashes bytes as the tar reader consumes them"""
+
+    def __init__(self, fileobj):
+        self._fileobj = fileobj
+        self.digest = hashlib.sha256()
+
+    def read(self, size=-1):
+        data = self._fileobj.read(size)
+        self.digest.update(data)
+        return data
+
+    def drain(self):
+        """Hash whatever trails the end-of-archive marker"""
+        while self.read(STREAM_BUFFER_SIZE):
+            pass
 
 
 class BackendInfo(BaseModel):
@@ -23,6 +109,7 @@ class BackendInfo(BaseModel):
     functions: List[str]
     version: str = "1.0.0"
     min_version: Optional[str] = None
+    sha256: Optional[str] = None
 
 
 class ModelInfo(BaseModel):
@@ -62,50 +149,130 @@ class ManifestManager:
         self.backends_dir = self.cache_dir / "backends"
         self.backends_dir.mkdir(parents=True, exist_ok=True)
         self._manifest = None
+        self._manifest_source = None
+        self._manifest_mtime = None
         self._loaded_backends = {}
+        self._backend_init_args = {}
         self._worker_backends = {}
+        self._cache = {}
+        self.manifest_cache_dir = self.cache_dir / "cache" / "manifests"
+        self.manifest_cache_dir.mkdir(parents=True, exist_ok=True)
 
     def _get_manifest_cache_file(self) -> Path:
         """Get path to manifest cache file"""
-        cache_dir = self.cache_dir / "cache" / "manifests"
-        cache_dir.mkdir(parents=True, exist_ok=True)
-        return cache_dir / "manifest_cache.json"
-
-    def _save_to_cache(self, data: dict):
-        """Save manifest data to cache"""
+        return self.manifest_cache_dir / "manifest_cache.json"
+
+    def _save_to_cache(self, data: dict, source: str = None, response=None) -> bool:
+        """Save manifest data to cache, along with the validators it was served with"""
+        payload = {
+            "url": source,
+            "etag": response.headers.get("ETag") if response is not None else None,
+            "last_modified": (
+                response.headers.get("Last-Modified") if response is not None else None
+            ),
+            "manifest": data,
+        }
         try:
             cache_file = self._get_manifest_cache_file()
-            with open(cache_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            # Write then rename so an interrupted save never leaves a truncated cache
+            tmp_file = cache_file.with_suffix(".tmp")
+            # Cache is machine-read only, so skip pretty-printing
+            if orjson is not None:
+                tmp_file.write_bytes(orjson.dumps(payload))
+            else:
+                with open(tmp_file, 'w') as f:
+                    json.dump(payload, f, separators=(",", ":"))
+            os.replace(tmp_file, cache_file)
+            return True
         except Exception:
-            pass
+            return False
 
-    def _load_from_cache(self) -> Optional[dict]:
-        """Load manifest data from cache"""
+    def _read_cache(self) -> Optional[dict]:
+        """Load the cache payload: the manifest plus the url/etag it came from"""
         try:
             cache_file = self._get_manifest_cache_file()
-            if cache_file.exists():
+            if orjson is not None:
+                payload = orjson.loads(cache_file.read_bytes())
+            else:
                 with open(cache_file) as f:
-                    return json.load(f)
+                    payload = json.load(f)
         except Exception:
-            pass
-        return None
+            return None
+
+        if not isinstance(payload, dict):
+            return None
+        if "manifest" not in payload or "url" not in payload:
+            # Older caches hold the bare manifest with no validators
+            return {"url": None, "manifest": payload}
+        return payload
+
+    def _load_from_cache(self, source: str = None) -> Optional[dict]:
+        """Load manifest data from cache, optionally only if it came from source"""
+        payload = self._read_cache()
+        if payload is None:
+            return None
+        if source is not None and payload.get("url") != source:
+            return None
+        return payload["manifest"]
+
+    def _load_validators(self, source: str) -> Dict[str, str]:
+        """Conditional GET headers for source, if the cache holds a copy of it"""
+        payload = self._read_cache()
+        if payload is None or payload.get("url") != source:
+            return {}
+
+        headers = {}
+        if payload.get("etag"):
+            headers["If-None-Match"] = payload["etag"]
+        if payload.get("last_modified"):
+            headers["If-Modified-Since"] = payload["last_modified"]
+        return headers
+
+    def _fetch_manifest(self, source: str, conditional: bool = True) -> Optional[dict]:
+        """Fetch the manifest, returning None if the cached copy is still current"""
+        headers = self._load_validators(source) if conditional else {}
+        response = _SESSION.get(source, headers=headers, timeout=NETWORK_TIMEOUT)
+        if response.status_code == 304:
+            return None
+
+        response.raise_for_status()
+        if orjson is not None:
+            data = orjson.loads(response.content)
+        else:
+            data = response.json()
 
-    def load_manifest(self, source: str, analytics=None, display=None) -> ManifestData:
+        # Cache successful fetch; validators live in the same file, so a failed
+        # write can't leave an ETag pointing at some other manifest
+        self._save_to_cache(data, source, response)
+        return data
+
+    def load_manifest(self, source: str, analytics=None) -> ManifestData:
         if source.startswith(("http://", "https://")):
             try:
-                # Always try fresh fetch first
-                response = requests.get(source, timeout=NETWORK_TIMEOUT)
-                response.raise_for_status()
-                data = response.json()
+                # Always check upstream first; unchanged manifests come back as 304
+                data = self._fetch_manifest(source)
+                fetch_source = "fresh_fetch"
 
-                # Cache successful fetch
-                self._save_to_cache(data)
+                if data is None:
+                    fetch_source = "not_modified"
+                    if self._manifest is not None and self._manifest_source == source:
+                        # Already parsed this exact manifest
+                        if analytics:
+                            analytics.track("manifest_load_success", {
+                                "source": fetch_source,
+                                "url": source
+                            })
+                        return self._manifest
+                    data = self._load_from_cache(source)
+                    if data is None:
+                        # Cache was replaced since the request went out
+                        data = self._fetch_manifest(source, conditional=False)
+                        fetch_source = "fresh_fetch"
 
                 # Track successful manifest load
                 if analytics:
                     analytics.track("manifest_load_success", {
-                        "source": "fresh_fetch",
+                        "source": fetch_source,
                         "url": source
                     })
 
@@ -132,9 +299,16 @@ class ManifestManager:
 
                 # Using cached version silently
         else:
-            # Local file - no caching needed
+            # Local file - reuse the parsed manifest while the file is untouched
             with open(source) as f:
-                data = json.load(f)
+                mtime = os.fstat(f.fileno()).st_mtime_ns
+                unchanged = (
+                    self._manifest is not None
+                    and self._manifest_source == source
+                    and self._manifest_mtime == mtime
+                )
+                if not unchanged:
+                    data = json.load(f)
 
             if analytics:
                 analytics.track("manifest_load_success", {
@@ -142,7 +316,13 @@ class ManifestManager:
                     "path": source
                 })
 
+            if unchanged:
+                return self._manifest
+            self._manifest_mtime = mtime
+
         self._manifest = ManifestData(**data)
+        self._manifest_source = source
+        self._cache.clear()
         return self._manifest
 
     def get_manifest(self) -> Optional[ManifestData]:
@@ -163,13 +343,21 @@ class ManifestManager:
             return {}
         return self._manifest.messages
 
+    def _get_backend_entry_path(self, backend_id: str) -> Path:
+        """Path to a backend's entry module, cached per loaded manifest"""
+        key = ("backend_path", backend_id)
+        if key not in self._cache:
+            entry_module = self._manifest.backends[backend_id].entry_module
+            self._cache[key] = self.backends_dir / backend_id / f"{entry_module}.py"
+        return self._cache[key]
+
     def download_backend(self, backend_id: str) -> bool:
         if not self._manifest or backend_id not in self._manifest.backends:
             return False
 
         backend_info = self._manifest.backends[backend_id]
-        backend_dir = self.backends_dir / backend_id
-        backend_file = backend_dir / f"{backend_info.entry_module}.py"
+        backend_file = self._get_backend_entry_path(backend_id)
+        backend_dir = backend_file.parent
         requirements_file = backend_dir / "requirements.txt"
 
         if backend_file.exists():
@@ -180,18 +368,37 @@ class ManifestManager:
 
         try:
             if backend_info.download_url.startswith(("http://", "https://")):
-                with tempfile.NamedTemporaryFile(suffix=".tar.gz", delete=False) as tmp_file:
-                    response = requests.get(backend_info.download_url, timeout=DOWNLOAD_TIMEOUT)
-                    response.raise_for_status()
-                    tmp_file.write(response.content)
-                    tmp_path = tmp_file.name
-
                 backend_dir.mkdir(parents=True, exist_ok=True)
 
-                with tarfile.open(tmp_path, "r:*") as tar:
-                    tar.extractall(backend_dir)
-
-                Path(tmp_path).unlink()
+                # Extract while downloading instead of staging the tarball on disk
+                try:
+                    with _SESSION.get(
+                        backend_info.download_url, stream=True, timeout=DOWNLOAD_TIMEOUT
+                    ) as response:
+                        response.raise_for_status()
+                        # Hash the bytes as published; "r|*" handles the compression
+                        response.raw.decode_content = False
+                        stream = _HashingReader(
+                            io.BufferedReader(response.raw, STREAM_BUFFER_SIZE)
+                        )
+                        with tarfile.open(
+                            fileobj=stream,
+                            mode="r|*",
+                            bufsize=TAR_BUFFER_SIZE,
+                            copybufsize=TAR_BUFFER_SIZE,
+                        ) as tar:
+                            tar.extractall(backend_dir, members=_backend_members(tar))
+
+                        if backend_info.sha256:
+                            stream.drain()
+                            if stream.digest.hexdigest() != backend_info.sha256.lower():
+                                raise ValueError(
+                                    f"Checksum mismatch for backend {backend_id}"
+                                )
+                except Exception:
+                    # Don't leave a partial backend that would look installed
+                    shutil.rmtree(backend_dir, ignore_errors=True)
+                    raise
 
                 extracted_dirs = [d for d in backend_dir.iterdir() if d.is_dir()]
                 if len(extracted_dirs) == 1:
@@ -207,7 +414,11 @@ class ManifestManager:
                 if backend_dir.exists():
                     shutil.rmtree(backend_dir)
 
-                shutil.copytree(source_dir, backend_dir)
+                shutil.copytree(
+                    source_dir,
+                    backend_dir,
+                    ignore=shutil.ignore_patterns("__pycache__", "*.pyc"),
+                )
 
             if not backend_file.exists():
                 return False
@@ -225,7 +436,7 @@ class ManifestManager:
         try:
             # Get requirements content
             if requirements_url.startswith(("http://", "https://")):
-                response = requests.get(requirements_url, timeout=NETWORK_TIMEOUT)
+                response = _SESSION.get(requirements_url, timeout=NETWORK_TIMEOUT)
                 response.raise_for_status()
                 requirements_content = response.text
             else:
@@ -234,19 +445,19 @@ class ManifestManager:
 
             # Parse requirements
             missing_requirements = []
-            for line in requirements_content.strip().split('\n'):
+            for line in requirements_content.splitlines():
                 line = line.strip()
                 if not line or line.startswith('#'):
                     continue
 
-                # Extract package name (handle ==, >=, <=, ~=, etc.)
-                package_spec = line.split(';')[0].strip()  # Remove environment markers
-                for op in ['==', '>=', '<=', '~=', '>', '<', '!=']:
-                    if op in package_spec:
-                        package_name = package_spec.split(op)[0].strip()
-                        break
-                else:
-                    package_name = package_spec.strip()
+                # Package name is the leading identifier, before any extras,
+                # version specifiers or environment markers
+                match = REQUIREMENT_NAME_RE.match(line)
+                if not match:
+                    # pip options and URL requirements are passed through as-is
+                    missing_requirements.append(line)
+                    continue
+                package_name = match.group(0)
 
                 # Check if package is installed
                 if not self._is_package_installed(package_name):
@@ -259,7 +470,15 @@ class ManifestManager:
                     f.write('\n'.join(missing_requirements))
 
                 # Build pip command
-                pip_cmd = [sys.executable, "-m", "pip", "install", "-r", str(requirements_path)]
+                pip_cmd = [
+                    sys.executable,
+                    "-m",
+                    "pip",
+                    "install",
+                    "--prefer-binary",
+                    "-r",
+                    str(requirements_path),
+                ]
 
                 # Add PyTorch index URL if needed
                 has_torch = any(
@@ -274,8 +493,9 @@ class ManifestManager:
 
                 result = subprocess.run(
                     pip_cmd,
-                    capture_output=True,
-                    text=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    env={**os.environ, **INSTALLER_ENV_OVERRIDES},
                 )
 
                 requirements_path.unlink(missing_ok=True)
@@ -287,26 +507,8 @@ class ManifestManager:
 
     def _is_package_installed(self, package_name: str) -> bool:
         """Check if a package is installed, handling import name differences"""
-        # Map of pip package names to import names
-        package_import_map = {
-            'pillow': 'PIL',
-            'pyyaml': 'yaml',
-            'pytorch': 'torch',
-            'tensorflow-cpu': 'tensorflow',
-            'tensorflow-gpu': 'tensorflow',
-            'scikit-learn': 'sklearn',
-            'beautifulsoup4': 'bs4',
-            'python-dateutil': 'dateutil',
-            'msgpack-python': 'msgpack',
-            'protobuf': 'google.protobuf',
-            'opencv-python': 'cv2',
-            'opencv-python-headless': 'cv2',
-            'python-dotenv': 'dotenv',
-            'typing-extensions': 'typing_extensions',
-        }
-
         # Get import name
-        import_name = package_import_map.get(package_name.lower(), package_name)
+        import_name = PACKAGE_IMPORT_MAP.get(package_name.lower(), package_name)
 
         # Try to import the package
         try:
@@ -321,13 +523,13 @@ class ManifestManager:
                 except ImportError:
                     pass
 
-            # Check using pip show as fallback
-            result = subprocess.run(
-                [sys.executable, "-m", "pip", "show", package_name],
-                capture_output=True,
-                text=True,
-            )
-            return result.returncode == 0
+            # Fall back to installed distribution metadata; same answer as
+            # `pip show` without spawning an interpreter per requirement
+            try:
+                importlib.metadata.distribution(package_name)
+                return True
+            except importlib.metadata.PackageNotFoundError:
+                return False
 
     def load_backend(self, backend_id: str) -> Optional[Any]:
         if backend_id in self._loaded_backends:
@@ -339,8 +541,7 @@ class ManifestManager:
         if not self._manifest or backend_id not in self._manifest.backends:
             return None
 
-        backend_info = self._manifest.backends[backend_id]
-        backend_path = self.backends_dir / backend_id / f"{backend_info.entry_module}.py"
+        backend_path = self._get_backend_entry_path(backend_id)
 
         try:
             spec = importlib.util.spec_from_file_location(backend_id, backend_path)
@@ -361,9 +562,12 @@ class ManifestManager:
         backend_id = model_info.backend
         backend = self.load_backend(backend_id)
 
-        # Initialize backend with model args if available
+        # Initialize backend with model args if available. init_backend drops
+        # the loaded model, so only call it when the args actually change
         if backend and model_info.args and hasattr(backend, "init_backend"):
-            backend.init_backend(**model_info.args)
+            if self._backend_init_args.get(backend_id) != model_info.args:
+                backend.init_backend(**model_info.args)
+                self._backend_init_args[backend_id] = dict(model_info.args)
 
         return backend
 
@@ -376,8 +580,7 @@ class ManifestManager:
         if not self._manifest or backend_id not in self._manifest.backends:
             return None
 
-        backend_info = self._manifest.backends[backend_id]
-        backend_path = self.backends_dir / backend_id / f"{backend_info.entry_module}.py"
+        backend_path = self._get_backend_entry_path(backend_id)
         worker_module_name = f"{backend_id}_worker_{worker_id}"
 
         try:
@@ -423,25 +626,39 @@ class ManifestManager:
         if not self._manifest:
             return None
 
-        for model_id, model_info in self._manifest.models.items():
-            if model_info.is_default:
-                return model_id
-        return None
+        if "default_model" not in self._cache:
+            self._cache["default_model"] = next(
+                (
+                    model_id
+                    for model_id, model_info in self._manifest.models.items()
+                    if model_info.is_default
+                ),
+                None,
+            )
+        return self._cache["default_model"]
 
     def get_available_default_model(self) -> Optional[str]:
         """Get the first available default model for the current OS"""
         if not self._manifest:
             return None
 
-        current_os = platform.system().lower()
+        # Results only change when a new manifest is loaded
+        if "available_default_model" in self._cache:
+            return self._cache["available_default_model"]
+
+        current_os = get_current_os()
+        result = None
 
         for model_id, model_info in self._manifest.models.items():
             if model_info.is_default:
                 # Check OS compatibility
                 if model_info.supported_os and current_os not in model_info.supported_os:
                     continue
-                return model_id
-        return None
+                result = model_id
+                break
+
+        self._cache["available_default_model"] = result
+        return result
 
     def get_version_messages(self, current_version: str) -> List[VersionMessage]:
         if not self._manifest or not self._manifest.version_messages:
@@ -451,23 +668,8 @@ class ManifestManager:
         current = Version(current_version)
 
         for msg in self._manifest.version_messages:
-            version_spec = msg.version
-            matches = False
-
-            if version_spec.startswith("<"):
-                target = Version(version_spec[1:].strip())
-                matches = current < target
-            elif version_spec.startswith(">"):
-                target = Version(version_spec[1:].strip())
-                matches = current > target
-            elif version_spec.startswith("=="):
-                target = Version(version_spec[2:].strip())
-                matches = current == target
-            else:
-                target = Version(version_spec)
-                matches = current == target
-
-            if matches:
+            op, target = VERSION_SPEC_RE.match(msg.version).groups()
+            if VERSION_SPEC_OPS[op](current, Version(target)):
                 applicable_messages.append(msg)
 
         return applicable_messages
@@ -1,7 +1,13 @@
-import platform
 from typing import List, Dict, Optional
+from packaging.version import Version
+
+from .. import __version__
+from .config import get_current_os
 from .manifest import ModelInfo
 
+# Parsed once; compared against every backend's min_version
+INSTALLED_VERSION = Version(__version__)
+
 
 class ModelManager:
     def __init__(self, config, manifest_manager=None):
@@ -40,7 +46,7 @@ class ModelManager:
         # Check OS compatibility
         model_info = models[name]
         if model_info.supported_os:
-            current_os = platform.system().lower()
+            current_os = get_current_os()
             if current_os not in model_info.supported_os:
                 return False
 
@@ -75,7 +81,7 @@ class ModelManager:
         manifest = (
             self.manifest_manager.get_manifest() if self.manifest_manager else None
         )
-        current_os = platform.system().lower()
+        current_os = get_current_os()
 
         # Check OS compatibility (same logic as display.py)
         if model_info.supported_os and current_os not in model_info.supported_os:
@@ -86,15 +92,12 @@ class ModelManager:
             backend_info = manifest.backends[model_info.backend]
             if backend_info.min_version:
                 try:
-                    from .. import __version__
-                    from packaging.version import Version
-
-                    if Version(__version__) < Version(backend_info.min_version):
+                    if INSTALLED_VERSION < Version(backend_info.min_version):
                         return (
                             False,
                             f"Requires version {backend_info.min_version} or newer",
                         )
-                except:
+                except Exception:
                     pass
 
         return True, ""
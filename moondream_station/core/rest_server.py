@@ -1,18 +1,56 @@
 import asyncio
+import functools
+import hmac
 import json
 import os
 import subprocess
 import time
+import traceback
 import uvicorn
 import logging
 
+from json.encoder import encode_basestring_ascii
 from threading import Thread, Event, Lock
 from typing import Any, Dict, Optional
 from fastapi import FastAPI, Request, HTTPException, Depends
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
 
+from .config import MAX_REQUEST_BYTES
 from .inference_service import InferenceService
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+DEFAULT_RESPONSE_CLASS = ORJSONResponse if orjson is not None else JSONResponse
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Keep proxies (nginx, RunPod's edge) from caching or coalescing token frames
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+def _sse_frame(payload: Dict[str, Any]) -> bytes:
+    """Encode one Server-Sent Events data frame"""
+    if orjson is not None:
+        return b"data: " + orjson.dumps(payload) + b"\n\n"
+    return f"data: {json.dumps(payload)}\n\n".encode()
+
+
+def _sse_chunk_frame(token: Any) -> bytes:
+    """Encode one token frame; string tokens skip the dict round-trip"""
+    if orjson is None and isinstance(token, str):
+        return f'data: {{"chunk": {encode_basestring_ascii(token)}}}\n\n'.encode()
+    return _sse_frame({"chunk": token})
+
+
+SSE_DONE_FRAME = b'data: {"completed": true}\n\n'
+
 
 class RestServer:
     def __init__(self, config, manifest_manager, session_state=None, analytics=None):
@@ -21,7 +59,11 @@ class RestServer:
         self.session_state = session_state
         self.analytics = analytics
         self.inference_service = InferenceService(config, manifest_manager)
-        self.app = FastAPI(title="Moondream Station Inference Server", version="1.0.0")
+        self.app = FastAPI(
+            title="Moondream Station Inference Server",
+            version="1.0.0",
+            default_response_class=DEFAULT_RESPONSE_CLASS,
+        )
         self.server = None
         self.server_thread = None
         
@@ -68,7 +110,7 @@ class RestServer:
                 detail="Missing X-API-Key header"
             )
             
-        if auth_header != api_key:
+        if not hmac.compare_digest(auth_header.encode(), str(api_key).encode()):
             raise HTTPException(
                 status_code=401, 
                 detail="Invalid API key"
@@ -76,14 +118,22 @@ class RestServer:
             
         return True
 
-    def _sse_event_generator(self, raw_generator):
+    async def _sse_event_generator(self, raw_generator):
         """Convert generator tokens to Server-Sent Events format with token counting"""
         token_count = 0
         start_time = time.time()
-
-        for token in raw_generator:
+        loop = asyncio.get_running_loop()
+        done = object()
+
+        # Only the blocking next() on the model generator runs in a thread;
+        # framing stays on the event loop
+        while True:
+            token = await loop.run_in_executor(None, next, raw_generator, done)
+            if token is done:
+                break
             token_count += 1
-            yield f"data: {json.dumps({'chunk': token})}\n\n"
+            # Yield ready-encoded frames so Starlette writes them as-is
+            yield _sse_chunk_frame(token)
 
         # Send final stats
         duration = time.time() - start_time
@@ -94,9 +144,9 @@ class RestServer:
                 "duration": round(duration, 2),
                 "tokens_per_sec": tokens_per_sec,
             }
-            yield f"data: {json.dumps({'stats': stats})}\n\n"
+            yield _sse_frame({"stats": stats})
 
-        yield f"data: {json.dumps({'completed': True})}\n\n"
+        yield SSE_DONE_FRAME
 
     def _setup_routes(self):
         @self.app.get("/health")
@@ -120,13 +170,7 @@ class RestServer:
 
         @self.app.get("/v1/stats")
         async def get_stats(auth: bool = Depends(self._verify_api_key)):
-            stats = self.inference_service.get_stats()
-            # Add requests processed from session state
-            if self.session_state:
-                stats["requests_processed"] = self.session_state.state["requests_processed"]
-            else:
-                stats["requests_processed"] = 0
-            return stats
+            return self.get_stats()
 
         @self.app.api_route(
             "/{path:path}", methods=["GET", "POST", "PUT", "DELETE", "PATCH"]
@@ -134,10 +178,24 @@ class RestServer:
         async def dynamic_route(request: Request, path: str, auth: bool = Depends(self._verify_api_key)):
             return await self._handle_dynamic_request(request, path)
 
+    def get_stats(self) -> Dict[str, Any]:
+        stats = self.inference_service.get_stats()
+        # Add requests processed from session state
+        if self.session_state:
+            stats["requests_processed"] = self.session_state.state["requests_processed"]
+        else:
+            stats["requests_processed"] = 0
+        return stats
+
     async def _handle_dynamic_request(self, request: Request, path: str):
         if not self.inference_service.is_running():
             raise HTTPException(status_code=503, detail="Inference service not running")
 
+        # Refuse oversized uploads before reading or decoding any of the body
+        content_length = request.headers.get("content-length")
+        if content_length and content_length.isdigit() and int(content_length) > MAX_REQUEST_BYTES:
+            raise HTTPException(status_code=413, detail="Request body too large")
+
         function_name = self._extract_function_name(path)
         kwargs = await self._extract_request_data(request)
 
@@ -164,10 +222,12 @@ class RestServer:
             success = not (isinstance(result, dict) and result.get("error"))
         except Exception as e:
             if self.analytics:
-                self.analytics.track_error(
+                self._track_in_background(
+                    self.analytics.track_error,
                     type(e).__name__,
                     str(e),
-                    f"api_{function_name}"
+                    f"api_{function_name}",
+                    tb=traceback.format_exc(),
                 )
             raise
 
@@ -186,7 +246,9 @@ class RestServer:
             if generator:
                 event_generator = self._sse_event_generator(generator)
                 return StreamingResponse(
-                    event_generator, media_type="text/event-stream"
+                    event_generator,
+                    media_type="text/event-stream",
+                    headers=SSE_HEADERS,
                 )
 
         # Add token stats and analytics for non-streaming responses
@@ -206,7 +268,8 @@ class RestServer:
                 }
 
             if self.analytics:
-                self.analytics.track_api_call(
+                self._track_in_background(
+                    self.analytics.track_api_call,
                     function_name,
                     duration,
                     tokens=token_count,
@@ -214,7 +277,16 @@ class RestServer:
                     model=self.config.get("current_model")
                 )
 
-        return JSONResponse(result)
+        return DEFAULT_RESPONSE_CLASS(result)
+
+    def _track_in_background(self, track_fn, *args, **kwargs):
+        """Fire-and-forget an analytics call on the default executor.
+
+        Tracking may probe Hugging Face and posts to PostHog; neither should
+        hold up the response or block the event loop.
+        """
+        loop = asyncio.get_running_loop()
+        loop.run_in_executor(None, functools.partial(track_fn, *args, **kwargs))
 
     def _extract_function_name(self, path: str) -> str:
         path_parts = [p for p in path.split("/") if p]
@@ -227,23 +299,23 @@ class RestServer:
     async def _extract_request_data(self, request: Request) -> Dict[str, Any]:
         kwargs = {}
 
-        content_type = request.headers.get("content-type", "")
+        # GET carries its arguments in the query string; don't read the body
+        content_type = (
+            request.headers.get("content-type", "") if request.method != "GET" else ""
+        )
 
         if "application/json" in content_type:
             try:
-                body = await request.json()
-                kwargs.update(body)
+                kwargs.update(_json_loads(await request.body()))
             except json.JSONDecodeError:
                 pass
-        elif "application/x-www-form-urlencoded" in content_type:
-            form = await request.form()
-            kwargs.update(dict(form))
-        elif "multipart/form-data" in content_type:
-            form = await request.form()
-            for key, value in form.items():
-                kwargs[key] = value
+        elif (
+            "application/x-www-form-urlencoded" in content_type
+            or "multipart/form-data" in content_type
+        ):
+            kwargs.update(await request.form())
 
-        kwargs.update(dict(request.query_params))
+        kwargs.update(request.query_params)
 
         kwargs["_headers"] = dict(request.headers)
         kwargs["_method"] = request.method
@@ -274,18 +346,42 @@ class RestServer:
             self.server_thread = Thread(target=self._run_server, daemon=True)
             self.server_thread.start()
 
-            time.sleep(1)
+            self._wait_for_startup()
 
             return self.is_running()
         except Exception:
             return False
 
+    def _wait_for_startup(self, timeout: float = 5.0):
+        """Poll uvicorn's started flag with exponential backoff"""
+        deadline = time.monotonic() + timeout
+        delay = 0.05
+        while (
+            not self.server.started
+            and self.server_thread.is_alive()
+            and time.monotonic() < deadline
+        ):
+            time.sleep(delay)
+            delay = min(delay * 1.5, 0.5)
+
     def _run_server(self):
+        # Give the server thread its own loop (uvloop when installed) instead of
+        # server.run(), which would set uvloop's policy for the whole process
+        loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
         try:
-            asyncio.run(self.server.serve())
+            loop.run_until_complete(self.server.serve())
         except Exception:
             # Suppress normal shutdown errors
             pass
+        finally:
+            try:
+                loop.run_until_complete(loop.shutdown_asyncgens())
+                loop.run_until_complete(loop.shutdown_default_executor())
+            except Exception:
+                pass
+            asyncio.set_event_loop(None)
+            loop.close()
 
     def stop(self) -> bool:
         """Stop the REST server properly"""
@@ -293,22 +389,21 @@ class RestServer:
         self._stop_shutdown_monitor()
         
         if self.server:
-            # Signal server to stop
+            # Signal server to stop; uvicorn drains in-flight requests first
             self.server.should_exit = True
 
-            # Force shutdown the server
-            if hasattr(self.server, "force_exit"):
-                self.server.force_exit = True
-
         # Wait for server thread to finish
         if self.server_thread and self.server_thread.is_alive():
             self.server_thread.join(timeout=3)
 
+            # Only force exit if the graceful drain did not finish in time
+            if self.server_thread.is_alive() and self.server:
+                self.server.force_exit = True
+                self.server_thread.join(timeout=1)
+
             # If thread is still alive, something went wrong
             if self.server_thread.is_alive():
-                import logging
-
-                logging.warning("Server thread did not shut down cleanly")
+                self.logger.warning("Server thread did not shut down cleanly")
 
         # Stop inference service
         if hasattr(self, "inference_service") and self.inference_service:
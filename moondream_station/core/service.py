@@ -1,8 +1,17 @@
+import errno
+import socket
 import time
 from typing import Optional
 from .rest_server import RestServer
 from .config import SERVICE_PORT, SERVICE_HOST
 
+# Windows reports socket errors with WSA codes rather than the CRT errno values
+_ADDR_IN_USE_ERRNOS = (
+    errno.EADDRINUSE,
+    getattr(errno, "WSAEADDRINUSE", errno.EADDRINUSE),
+    getattr(errno, "WSAEACCES", errno.EADDRINUSE),  # exclusive bind refused
+)
+
 
 class ServiceManager:
     def __init__(self, config, manifest_manager=None, session_state=None, analytics=None):
@@ -20,13 +29,18 @@ class ServiceManager:
         if not self.manifest_manager:
             return False
 
+        host = self.config.get("service_host", SERVICE_HOST)
+
+        # A taken port fails fast here instead of after backend and worker setup
+        if not self._port_available(host, port):
+            return False
+
         try:
             backend = self.manifest_manager.get_backend_for_model(model_name)
             if not backend:
                 return False
 
             self.rest_server = RestServer(self.config, self.manifest_manager, self.session_state, self.analytics)
-            host = self.config.get("service_host", SERVICE_HOST)
 
             if self.rest_server.start(host, port):
                 self.config.set("service_port", port)
@@ -54,10 +68,41 @@ class ServiceManager:
     def restart(self, model_name: str, port: Optional[int] = None) -> bool:
         """Restart the service"""
         self.stop()
-        time.sleep(1)
-        return self.start(
-            model_name, port or self.config.get("service_port", SERVICE_PORT)
-        )
+        port = port or self.config.get("service_port", SERVICE_PORT)
+        self._wait_for_port_release(port)
+        return self.start(model_name, port)
+
+    def _wait_for_port_release(self, port: int, timeout: float = 2.0):
+        """Poll until the port can be bound again, with exponential backoff"""
+        host = self.config.get("service_host", SERVICE_HOST)
+        deadline = time.monotonic() + timeout
+        delay = 0.05
+        while time.monotonic() < deadline:
+            if self._port_available(host, port):
+                return
+            time.sleep(delay)
+            delay = min(delay * 1.5, 0.5)
+
+    @staticmethod
+    def _port_available(host: str, port: int) -> bool:
+        """Check the port can be bound, ignoring sockets left in TIME_WAIT"""
+        try:
+            # Resolve the family too, so IPv6 hosts like "::" probe correctly
+            family, sock_type, proto, _, addr = socket.getaddrinfo(
+                host, port, type=socket.SOCK_STREAM
+            )[0]
+            with socket.socket(family, sock_type, proto) as sock:
+                # Windows lets SO_REUSEADDR bind over a live listener, so ask for
+                # exclusive use there; elsewhere match uvicorn's SO_REUSEADDR
+                if hasattr(socket, "SO_EXCLUSIVEADDRUSE"):
+                    sock.setsockopt(socket.SOL_SOCKET, socket.SO_EXCLUSIVEADDRUSE, 1)
+                else:
+                    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                sock.bind(addr)
+        except OSError as e:
+            # Only a taken port is a verdict; leave other errors for uvicorn to report
+            return e.errno not in _ADDR_IN_USE_ERRNOS
+        return True
 
     def get_status(self) -> dict:
         """Get service status information"""
@@ -1,7 +1,7 @@
 import time
 import threading
 import queue
-from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError, Future
+from concurrent.futures import TimeoutError as FutureTimeoutError, Future
 from typing import Any, Dict, Optional, Callable
 
 
@@ -10,7 +10,6 @@ class SimpleWorkerPool:
         self.n_workers = n_workers
         self.max_queue_size = max_queue_size
         self.default_timeout = default_timeout
-        self.executor = ThreadPoolExecutor(max_workers=n_workers)
         self.request_queue = queue.Queue(maxsize=max_queue_size)
         self.processing_count = 0
         self.timeout_count = 0
@@ -25,12 +24,17 @@ class SimpleWorkerPool:
         """Worker thread that processes requests from the queue"""
         while self._running:
             try:
-                # Get request from queue with timeout
-                request_item = self.request_queue.get(timeout=1.0)
+                # Block until work arrives; shutdown() wakes us with a sentinel
+                request_item = self.request_queue.get()
                 if request_item is None:  # Shutdown signal
                     break
                     
                 function, timeout, kwargs, result_future = request_item
+
+                # Caller already gave up (timeout/disconnect) before we got to it
+                if not result_future.set_running_or_notify_cancel():
+                    self.request_queue.task_done()
+                    continue
                 
                 # Increment processing count
                 with self._lock:
@@ -49,31 +53,35 @@ class SimpleWorkerPool:
                         self.processing_count -= 1
                     self.request_queue.task_done()
                     
-            except queue.Empty:
-                continue
             except Exception:
                 break
         
+    def submit(self, function: Callable, timeout: Optional[float] = None, **kwargs) -> Future:
+        """Queue a request and return its Future; raises queue.Full when saturated"""
+        result_future = Future()
+        request_item = (function, timeout or self.default_timeout, kwargs, result_future)
+        self.request_queue.put(request_item, block=False)
+        return result_future
+
+    def record_timeout(self):
+        with self._lock:
+            self.timeout_count += 1
+
     def submit_request(self, function: Callable, timeout: Optional[float] = None, **kwargs) -> Dict[str, Any]:
         # Check if queue is full
         if self.request_queue.full():
             return {"error": "Queue is full", "status": "rejected"}
         
         try:
-            # Create a future to get the result
-            result_future = Future()
-            
-            # Put request in queue
-            request_item = (function, timeout or self.default_timeout, kwargs, result_future)
-            self.request_queue.put(request_item, block=False)
+            result_future = self.submit(function, timeout, **kwargs)
             
             # Wait for result
             try:
                 result = result_future.result(timeout=timeout or self.default_timeout)
                 return result
             except FutureTimeoutError:
-                with self._lock:
-                    self.timeout_count += 1
+                result_future.cancel()
+                self.record_timeout()
                 return {"error": "Request timeout", "status": "timeout"}
                 
         except queue.Full:
@@ -94,12 +102,24 @@ class SimpleWorkerPool:
     
     def shutdown(self):
         self._running = False
-        
+
+        # Fail anything still queued so callers aren't left waiting on it
+        while True:
+            try:
+                request_item = self.request_queue.get_nowait()
+            except queue.Empty:
+                break
+            if request_item is not None:
+                result_future = request_item[3]
+                if result_future.set_running_or_notify_cancel():
+                    result_future.set_result(
+                        {"error": "Inference service stopped", "status": "error"}
+                    )
+            self.request_queue.task_done()
+
         # Signal workers to stop by putting None in queue
         for _ in range(self.n_workers):
             try:
-                self.request_queue.put(None, block=False)
+                self.request_queue.put(None, timeout=1.0)
             except queue.Full:
-                pass
-        
-        self.executor.shutdown(wait=True)
\ No newline at end of file
+                pass
\ No newline at end of file
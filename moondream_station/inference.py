@@ -1,6 +1,7 @@
 import base64
 import inspect
 import shlex
+import sys
 import time
 from pathlib import Path
 from typing import Any, Callable, Dict, List
@@ -11,6 +12,15 @@ from rich.panel import Panel
 
 from .core.config import PANEL_WIDTH
 
+STREAM_FLUSH_INTERVAL = 0.016  # ~60 fps
+
+INFERENCE_MODE_COMMANDS = (
+    "\n[dim]Commands:[/dim]\n"
+    "  [bold]exit[/bold] - Return to main mode\n"
+    "  [bold]help[/bold] - Show this help\n"
+    "  [bold]clear[/bold] - Clear screen"
+)
+
 
 class InferenceHandler:
     def __init__(self, repl_session):
@@ -124,25 +134,20 @@ class InferenceHandler:
         """Enter dedicated inference mode"""
         self.repl.console.clear()
 
-        combined_content = "Available functions:\n"
+        lines = ["Available functions:"]
         for func_name in backend_info.functions:
             if hasattr(backend, func_name):
                 func = getattr(backend, func_name)
                 signature = self._get_function_signature(func, func_name)
-                line = f"  [bold cyan]{func_name}[/bold cyan] {signature}\n"
-                combined_content += line
+                lines.append(f"  [bold cyan]{func_name}[/bold cyan] {signature}")
             else:
-                combined_content += (
-                    f"  [bold cyan]{func_name}[/bold cyan] <image_path> [args]\n"
+                lines.append(
+                    f"  [bold cyan]{func_name}[/bold cyan] <image_path> [args]"
                 )
-
-        combined_content += "\n[dim]Commands:[/dim]\n"
-        combined_content += "  [bold]exit[/bold] - Return to main mode\n"
-        combined_content += "  [bold]help[/bold] - Show this help\n"
-        combined_content += "  [bold]clear[/bold] - Clear screen"
+        lines.append(INFERENCE_MODE_COMMANDS)
 
         inference_panel = Panel(
-            combined_content.strip(),
+            "\n".join(lines),
             title="[bold green]● INFERENCE MODE[/bold green]",
             border_style="green",
             width=PANEL_WIDTH,
@@ -282,9 +287,19 @@ class InferenceHandler:
 
             for key, value in result.items():
                 if hasattr(value, "__iter__") and hasattr(value, "__next__"):
+                    # Tokens arrive straight from the backend generator; write
+                    # each one as it comes without print()'s per-call overhead,
+                    # flushing at most once per frame
+                    write, flush = sys.stdout.write, sys.stdout.flush
+                    last_flush = time.monotonic()
                     for token in value:
-                        print(token, end="", flush=True)
+                        write(str(token))
                         token_count += 1
+                        now = time.monotonic()
+                        if now - last_flush >= STREAM_FLUSH_INTERVAL:
+                            flush()
+                            last_flush = now
+                    flush()
                     print()
 
                     duration = time.time() - start_time
@@ -3,15 +3,18 @@ import sys
 import subprocess
 import venv
 import json
+import os
 import uuid
 import platform
 import contextlib
+import hashlib
 import requests
 import shutil
-import time
 import random
 import re
 import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import Optional
 
@@ -24,17 +27,44 @@ from rich.console import Console
 from rich import print as rprint
 from rich.prompt import Prompt as RichPrompt
 
-DEFAULT_MANIFEST_URL = "https://m87-md-prod-assets.s3.us-west-2.amazonaws.com/station/mds2/production_manifest.json"
+from .core.config import DEFAULT_MANIFEST_URL, INSTALLER_ENV_OVERRIDES, get_app_dir
+
+# "Cuda compilation tools, release 12.6, V12.6.77"
+NVCC_RELEASE_RE = re.compile(r"release\s+(\d+\.\d+)")
+NVIDIA_SMI_CUDA_RE = re.compile(r"CUDA Version:\s*(\d+\.\d+)")
+
+PACKAGE_DIR = Path(__file__).parent
+PROJECT_ROOT = PACKAGE_DIR.parent
+
+INSTALLER_ENV = {**os.environ, **INSTALLER_ENV_OVERRIDES}
+
+IS_MACOS = sys.platform == "darwin"
+IS_WINDOWS = sys.platform == "win32"
+
+# One keep-alive pool for the manifest, model hub and requirements fetches
+_SESSION = requests.Session()
+
+PLATFORM_PROPERTIES = {
+    "platform": platform.system(),
+    "python_version": platform.python_version(),
+}
 
 
 class MoondreamStationLauncher:
     def __init__(self, dev_mode: bool = False):
-        self.app_dir = Path.home() / ".moondream-station"
+        self.app_dir = get_app_dir()
         self.venv_dir = self.app_dir / "venv"
+        self.config_file = self.app_dir / "config.json"
+        self.manifest_cache_file = (
+            self.app_dir / "models" / "cache" / "manifests" / "manifest_cache.json"
+        )
         self.python_exe = self._get_venv_python()
         self.analytics_client = None
         self.console = Console()
         self.dev_mode = dev_mode
+        self._manifests = {}
+        self._manifests_lock = threading.Lock()
+        self._config = None
         self._setup_analytics()
 
     @contextlib.contextmanager
@@ -49,39 +79,126 @@ class MoondreamStationLauncher:
             task = progress.add_task(description=message, total=None)
             yield progress, task
 
-    def _setup_analytics(self):
-        """Setup analytics from manifest if available"""
-        # Check we can access a Moondream Model
+    def _run_with_spinner(self, cmd: list, messages: list) -> subprocess.CompletedProcess:
+        """Run a long install command while cycling spinner messages"""
+        process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            env=INSTALLER_ENV,
+        )
+
+        # Drain stderr in the background so a chatty child can't fill the pipe and block
+        stderr_chunks = []
+        drain = threading.Thread(
+            target=lambda: stderr_chunks.append(process.stderr.read()), daemon=True
+        )
+        drain.start()
+
+        # One live spinner for the whole install; Rich animates it from its own
+        # refresh thread while this one just rotates the description
         try:
-            response = requests.get(
+            with self.spinner(random.choice(messages)) as (progress, task):
+                while True:
+                    wait_time = random.randint(3, 9)
+                    # Wake as soon as the installer exits rather than finishing the nap
+                    try:
+                        process.wait(timeout=wait_time)
+                        break
+                    except subprocess.TimeoutExpired:
+                        progress.update(task, description=random.choice(messages))
+        except BaseException:
+            # Ctrl-C etc.: don't leave pip/uv running behind the launcher
+            self._terminate_process(process)
+            raise
+
+        drain.join()
+        process.stderr.close()
+        return subprocess.CompletedProcess(
+            cmd, process.returncode, stderr="".join(stderr_chunks)
+        )
+
+    def _terminate_process(self, process: subprocess.Popen, timeout: float = 5):
+        """Stop a child process, escalating to kill if it ignores SIGTERM"""
+        if process.poll() is not None:
+            return
+        process.terminate()
+        try:
+            process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+    def _can_reach_model_hub(self) -> bool:
+        """Check we can access a Moondream Model"""
+        try:
+            response = _SESSION.get(
                 "https://huggingface.co/vikhyatk/moondream2/resolve/main/config.json",
                 timeout=2,
             )
-            if response.status_code != 200:
-                return
-        except:
-            return
+            return response.status_code == 200
+        except Exception:
+            return False
+
+    def _fetch_manifest(self, source: str, timeout: float = 30) -> dict:
+        """Load a manifest from a URL or local path, once per launch"""
+        # Memoize the in-flight Future so concurrent callers share one request
+        with self._manifests_lock:
+            future = self._manifests.get(source)
+            owner = future is None
+            if owner:
+                future = self._manifests[source] = Future()
+        if not owner:
+            return future.result()
 
-        # Try to load analytics config from manifest
         try:
-            manifest_data = None
+            if source.startswith(("http://", "https://")):
+                response = _SESSION.get(source, timeout=timeout)
+                response.raise_for_status()
+                data = response.json()
+            else:
+                with open(source) as f:
+                    data = json.load(f)
+        except BaseException as e:
+            # Hand the error to anyone waiting, but let later calls retry
+            with self._manifests_lock:
+                del self._manifests[source]
+            future.set_exception(e)
+            raise
+        future.set_result(data)
+        return data
 
-            # First try to fetch from URL
+    def _load_manifest_data(self) -> Optional[dict]:
+        """Fetch the manifest, falling back to the on-disk cache"""
+        try:
+            return self._fetch_manifest(DEFAULT_MANIFEST_URL, timeout=5)
+        except Exception:
             try:
-                response = requests.get(DEFAULT_MANIFEST_URL, timeout=5)
-                response.raise_for_status()
-                manifest_data = response.json()
-            except:
-                cache_file = (
-                    self.app_dir
-                    / "models"
-                    / "cache"
-                    / "manifests"
-                    / "manifest_cache.json"
-                )
-                if cache_file.exists():
-                    with open(cache_file) as f:
-                        manifest_data = json.load(f)
+                with open(self.manifest_cache_file) as f:
+                    cached = json.load(f)
+                # The app stores the manifest alongside its url/etag
+                if "manifest" in cached and "url" in cached:
+                    return cached["manifest"]
+                return cached
+            except FileNotFoundError:
+                pass
+        return None
+
+    def _setup_analytics(self):
+        """Setup analytics from manifest if available"""
+        # Both requests are independent network round-trips; overlap them
+        executor = ThreadPoolExecutor(max_workers=2)
+        hub_check = executor.submit(self._can_reach_model_hub)
+        manifest_fetch = executor.submit(self._load_manifest_data)
+        executor.shutdown(wait=False)
+
+        if not hub_check.result():
+            return
+
+        # Try to load analytics config from manifest
+        try:
+            manifest_data = manifest_fetch.result()
 
             if not manifest_data:
                 return
@@ -97,15 +214,10 @@ class MoondreamStationLauncher:
                 self.analytics_client = posthog
 
                 # Get or create user ID
-                config_file = self.app_dir / "config.json"
-                user_id = None
-                if config_file.exists():
-                    try:
-                        with open(config_file) as f:
-                            config = json.load(f)
-                        user_id = config.get("user_id")
-                    except:
-                        pass
+                try:
+                    user_id = self._read_config().get("user_id")
+                except Exception:
+                    user_id = None
 
                 if not user_id:
                     user_id = str(uuid.uuid4())
@@ -122,12 +234,7 @@ class MoondreamStationLauncher:
         if properties is None:
             properties = {}
 
-        properties.update(
-            {
-                "platform": platform.system(),
-                "python_version": platform.python_version(),
-            }
-        )
+        properties.update(PLATFORM_PROPERTIES)
 
         try:
             self.analytics_client.capture(
@@ -138,20 +245,19 @@ class MoondreamStationLauncher:
 
     def _get_venv_python(self) -> Path:
         """Get path to venv Python executable"""
-        if sys.platform == "win32":
+        if IS_WINDOWS:
             return self.venv_dir / "Scripts" / "python.exe"
         return self.venv_dir / "bin" / "python"
 
     def _venv_exists(self) -> bool:
         """Check if venv exists and is valid"""
-        if not (self.python_exe.exists() and self.python_exe.is_file()):
+        if not self.python_exe.is_file():
             return False
 
-        # Check that pip is available in the venv
-        result = subprocess.run(
-            [str(self.python_exe), "-m", "pip", "--version"], capture_output=True
-        )
-        return result.returncode == 0
+        # Check that pip is available in the venv; its entry script is
+        # installed alongside the interpreter, so no need to start Python
+        pip_name = "pip.exe" if IS_WINDOWS else "pip"
+        return (self.python_exe.parent / pip_name).is_file()
 
     def _create_venv(self):
         """Create virtual environment"""
@@ -164,22 +270,15 @@ class MoondreamStationLauncher:
 
         try:
             with self.spinner("Setting up Moondream Station environment"):
+                # UV doesn't install pip by default, but we need it as fallback;
+                # --seed adds it during venv creation instead of a second uv run
                 result = subprocess.run(
-                    ["uv", "venv", str(self.venv_dir)], capture_output=True, text=True
+                    ["uv", "venv", "--seed", str(self.venv_dir)],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    env=INSTALLER_ENV,
                 )
                 if result.returncode == 0:
-                    # UV doesn't install pip by default, but we need it as fallback
-                    subprocess.run(
-                        [
-                            "uv",
-                            "pip",
-                            "install",
-                            "--python",
-                            str(self.python_exe),
-                            "pip",
-                        ],
-                        capture_output=True,
-                    )
                     self._track("env_setup_success", {"method": "uv"})
                     return
         except FileNotFoundError:
@@ -202,8 +301,17 @@ class MoondreamStationLauncher:
         """Install required packages from requirements.txt"""
         self._track("requirements_install_start")
 
-        moondream_station_root = Path(__file__).parent
-        requirements_file = moondream_station_root / "requirements.txt"
+        requirements_file = PACKAGE_DIR / "requirements.txt"
+
+        # Skip the resolve entirely when this venv already has these requirements
+        fingerprint = hashlib.sha256(requirements_file.read_bytes()).hexdigest()
+        marker = self.venv_dir / ".requirements.sha256"
+        try:
+            if marker.read_text() == fingerprint:
+                self._track("requirements_install_skipped")
+                return
+        except OSError:
+            pass
 
         try:
             result = subprocess.run(
@@ -216,10 +324,12 @@ class MoondreamStationLauncher:
                     "-r",
                     str(requirements_file),
                 ],
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                env=INSTALLER_ENV,
             )
             if result.returncode == 0:
+                marker.write_text(fingerprint)
                 self._track("requirements_install_success", {"tool": "uv"})
                 return
         except FileNotFoundError:
@@ -230,6 +340,7 @@ class MoondreamStationLauncher:
             "-m",
             "pip",
             "install",
+            "--prefer-binary",
             "-r",
             str(requirements_file),
         ]
@@ -245,32 +356,21 @@ class MoondreamStationLauncher:
             "Building dependencies",
         ]
 
-        process = subprocess.Popen(
-            cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
-        )
-
-        while process.poll() is None:
-            msg = random.choice(messages)
-            wait_time = random.randint(3, 9)
-            with self.spinner(msg):
-                time.sleep(wait_time)
-
-        stdout, stderr = process.communicate()
+        result = self._run_with_spinner(cmd, messages)
 
-        if process.returncode != 0:
+        if result.returncode != 0:
             self._track(
                 "requirements_install_failed",
-                {"error": stderr, "returncode": process.returncode, "tool": "pip"},
+                {"error": result.stderr, "returncode": result.returncode, "tool": "pip"},
             )
-            rprint(f"[red]❌ Failed to install packages: {stderr}[/red]")
+            rprint(f"[red]❌ Failed to install packages: {result.stderr}[/red]")
             sys.exit(1)
         else:
+            marker.write_text(fingerprint)
             self._track("requirements_install_success", {"tool": "pip"})
 
     def _install_moondream_station(self):
         """Install moondream-station package"""
-        moondream_station_root = Path(__file__).parent.parent
-
         if self.dev_mode:
             try:
                 result = subprocess.run(
@@ -281,10 +381,11 @@ class MoondreamStationLauncher:
                         "--python",
                         str(self.python_exe),
                         "-e",
-                        str(moondream_station_root),
+                        str(PROJECT_ROOT),
                     ],
-                    capture_output=True,
-                    text=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    env=INSTALLER_ENV,
                 )
                 if result.returncode == 0:
                     return
@@ -297,7 +398,7 @@ class MoondreamStationLauncher:
                 "pip",
                 "install",
                 "-e",
-                str(moondream_station_root),
+                str(PROJECT_ROOT),
             ]
         else:
             try:
@@ -310,18 +411,32 @@ class MoondreamStationLauncher:
                         str(self.python_exe),
                         "moondream-station",
                     ],
-                    capture_output=True,
-                    text=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    env=INSTALLER_ENV,
                 )
                 if result.returncode == 0:
                     return
             except FileNotFoundError:
                 pass
 
-            cmd = [str(self.python_exe), "-m", "pip", "install", "moondream-station"]
+            cmd = [
+                str(self.python_exe),
+                "-m",
+                "pip",
+                "install",
+                "--prefer-binary",
+                "moondream-station",
+            ]
 
         with self.spinner("Installing moondream-station package"):
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = subprocess.run(
+                cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+                env=INSTALLER_ENV,
+            )
 
         if result.returncode != 0:
             rprint(
@@ -329,27 +444,21 @@ class MoondreamStationLauncher:
             )
             sys.exit(1)
 
-    def _install_backend_requirements(self, args: list[str]):
-        """Install backend requirements if manifest is specified"""
-        manifest_path = None
+    def _get_manifest_path(self, args: list[str]) -> str:
+        """Manifest passed via --manifest/-m, or the default manifest URL"""
         for i, arg in enumerate(args):
             if arg in ["--manifest", "-m"] and i + 1 < len(args):
-                manifest_path = args[i + 1]
-                break
+                return args[i + 1]
+        return DEFAULT_MANIFEST_URL
 
-        # Use default manifest URL if none specified
-        if not manifest_path:
-            manifest_path = DEFAULT_MANIFEST_URL
+    def _install_backend_requirements(self, args: list[str]):
+        """Install backend requirements if manifest is specified"""
+        manifest_path = self._get_manifest_path(args)
 
         try:
             self._track("backend_requirements_start", {"manifest_path": manifest_path})
 
-            if manifest_path.startswith(("http://", "https://")):
-                response = requests.get(manifest_path, timeout=30)
-                manifest_data = response.json()
-            else:
-                with open(manifest_path) as f:
-                    manifest_data = json.load(f)
+            manifest_data = self._fetch_manifest(manifest_path)
 
             for backend_id, backend_info in manifest_data.get(
                 "backends", {}
@@ -367,46 +476,41 @@ class MoondreamStationLauncher:
             )
             rprint(f"[yellow]⚠️  Could not install backend requirements: {e}[/yellow]")
 
+    def _read_config(self) -> dict:
+        """Read the shared config.json once and keep it for the rest of the launch"""
+        if self._config is None:
+            try:
+                with open(self.config_file) as f:
+                    self._config = json.load(f)
+            except FileNotFoundError:
+                self._config = {}
+        return self._config
+
+    def _update_config(self, **values):
+        """Merge values into config.json"""
+        config = self._read_config()
+        config.update(values)
+        tmp_file = self.config_file.with_suffix(".tmp")
+        with open(tmp_file, "w") as f:
+            json.dump(config, f, indent=2)
+        os.replace(tmp_file, self.config_file)
+
     def _get_stored_cuda_version(self) -> Optional[str]:
         """Get the CUDA version that was used for installation"""
-        config_file = self.app_dir / "config.json"
-        if config_file.exists():
-            with open(config_file) as f:
-                config = json.load(f)
-                return config.get("torch_cuda_version")
-        return None
+        return self._read_config().get("torch_cuda_version")
 
     def _store_cuda_version(self, cuda_version: Optional[str]):
         """Store the CUDA version used for installation"""
-        config_file = self.app_dir / "config.json"
-        config = {}
-        if config_file.exists():
-            with open(config_file) as f:
-                config = json.load(f)
-        config["torch_cuda_version"] = cuda_version or "none"
-        with open(config_file, "w") as f:
-            json.dump(config, f, indent=2)
+        self._update_config(torch_cuda_version=cuda_version or "none")
 
     def _get_stored_torch_index(self) -> Optional[str]:
         """Get the stored PyTorch index URL"""
-        config_file = self.app_dir / "config.json"
-        if config_file.exists():
-            with open(config_file) as f:
-                config = json.load(f)
-                url = config.get("torch_index_url")
-                return url if url != "none" else None
-        return None
+        url = self._read_config().get("torch_index_url")
+        return url if url != "none" else None
 
     def _store_torch_index(self, index_url: Optional[str]):
         """Store the PyTorch index URL used"""
-        config_file = self.app_dir / "config.json"
-        config = {}
-        if config_file.exists():
-            with open(config_file) as f:
-                config = json.load(f)
-        config["torch_index_url"] = index_url or "none"
-        with open(config_file, "w") as f:
-            json.dump(config, f, indent=2)
+        self._update_config(torch_index_url=index_url or "none")
 
     def _prompt_cuda_version(self, detected_cuda: Optional[str]) -> list:
         """Prompt user to select CUDA version for PyTorch"""
@@ -432,7 +536,7 @@ class MoondreamStationLauncher:
         else:
             rprint("\n[yellow]No CUDA detected on this system[/yellow]")
             rprint("[dim]Select the version you want to install PyTorch for:[/dim]\n")
-            if sys.platform != "darwin":
+            if not IS_MACOS:
                 default_index = 5  # CPU only
 
         # Show options in a table
@@ -476,7 +580,7 @@ class MoondreamStationLauncher:
 
     def _detect_cuda_version(self) -> Optional[str]:
         """Detect CUDA version on Windows/Linux systems"""
-        if sys.platform == "darwin":
+        if IS_MACOS:
             return None
 
         # First try to get actual CUDA toolkit version from nvcc
@@ -489,8 +593,7 @@ class MoondreamStationLauncher:
             )
 
             if result.returncode == 0:
-                # Parse version from "Cuda compilation tools, release 12.6, V12.6.77"
-                match = re.search(r"release\s+(\d+\.\d+)", result.stdout)
+                match = NVCC_RELEASE_RE.search(result.stdout)
                 if match:
                     return match.group(1)
         except (subprocess.TimeoutExpired, FileNotFoundError, Exception):
@@ -499,18 +602,11 @@ class MoondreamStationLauncher:
         # Fall back to nvidia-smi to check driver's CUDA capability
         try:
             result = subprocess.run(
-                ["nvidia-smi", "--query-gpu=driver_version", "--format=csv,noheader"],
-                capture_output=True,
-                text=True,
-                timeout=5,
+                ["nvidia-smi"], capture_output=True, text=True, timeout=5
             )
 
             if result.returncode == 0:
-                cuda_result = subprocess.run(
-                    ["nvidia-smi"], capture_output=True, text=True, timeout=5
-                )
-
-                match = re.search(r"CUDA Version:\s*(\d+\.\d+)", cuda_result.stdout)
+                match = NVIDIA_SMI_CUDA_RE.search(result.stdout)
                 if match:
                     return match.group(1)
         except (subprocess.TimeoutExpired, FileNotFoundError, Exception):
@@ -522,11 +618,10 @@ class MoondreamStationLauncher:
         """Install requirements from URL or local path"""
         try:
             if requirements_url.startswith(("http://", "https://")):
-                response = requests.get(requirements_url, timeout=30)
+                response = _SESSION.get(requirements_url, timeout=30)
                 requirements_content = response.text
             else:
-                moondream_station_root = Path(__file__).parent.parent
-                requirements_path = moondream_station_root / requirements_url
+                requirements_path = PROJECT_ROOT / requirements_url
                 with open(requirements_path) as f:
                     requirements_content = f.read()
 
@@ -542,7 +637,7 @@ class MoondreamStationLauncher:
                 for pkg in requirements_content.lower().split("\n")
             )
 
-            if has_torch and sys.platform != "darwin":
+            if has_torch and not IS_MACOS:
                 current_cuda = self._detect_cuda_version()
                 stored_cuda = self._get_stored_cuda_version()
 
@@ -578,9 +673,6 @@ class MoondreamStationLauncher:
                 ] + extra_args
 
                 # Run UV with progress indication
-                import time
-                import random
-
                 messages = [
                     "Installing backend requirements",
                     "Setting up ML dependencies",
@@ -592,19 +684,9 @@ class MoondreamStationLauncher:
                     "Building ML components",
                 ]
 
-                process = subprocess.Popen(
-                    cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
-                )
-
-                while process.poll() is None:
-                    msg = random.choice(messages)
-                    wait_time = random.randint(3, 9)
-                    with self.spinner(msg):
-                        time.sleep(wait_time)
-
-                stdout, stderr = process.communicate()
+                result = self._run_with_spinner(cmd, messages)
 
-                if process.returncode == 0:
+                if result.returncode == 0:
                     Path(temp_path).unlink()
                     return
             except FileNotFoundError:
@@ -616,6 +698,7 @@ class MoondreamStationLauncher:
                 "-m",
                 "pip",
                 "install",
+                "--prefer-binary",
                 "-r",
                 temp_path,
             ] + extra_args
@@ -631,22 +714,12 @@ class MoondreamStationLauncher:
                 "Building ML components (via pip)",
             ]
 
-            process = subprocess.Popen(
-                cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
-            )
-
-            while process.poll() is None:
-                msg = random.choice(messages)
-                wait_time = random.randint(3, 9)
-                with self.spinner(msg):
-                    time.sleep(wait_time)
-
-            stdout, stderr = process.communicate()
+            result = self._run_with_spinner(cmd, messages)
             Path(temp_path).unlink()
 
-            if process.returncode != 0:
+            if result.returncode != 0:
                 rprint(
-                    f"[yellow]⚠️  Some backend requirements failed to install: {stderr}[/yellow]"
+                    f"[yellow]⚠️  Some backend requirements failed to install: {result.stderr}[/yellow]"
                 )
 
         except Exception as e:
@@ -656,11 +729,19 @@ class MoondreamStationLauncher:
 
     def _setup_environment(self, args: list[str]):
         """Set up the complete environment"""
+        # The manifest is only needed for the backend step at the end; fetch it
+        # while the venv and base requirements are being installed
+        executor = ThreadPoolExecutor(max_workers=1)
+        manifest_prefetch = executor.submit(
+            self._fetch_manifest, self._get_manifest_path(args)
+        )
+        executor.shutdown(wait=False)
+
         if not self._venv_exists():
             self._create_venv()
 
         # Configure CUDA on first run if needed (Windows/Linux only)
-        if sys.platform != "darwin":
+        if not IS_MACOS:
             stored_cuda = self._get_stored_cuda_version()
             if stored_cuda is None:
                 # First time setup - detect CUDA and let user choose PyTorch version
@@ -674,6 +755,9 @@ class MoondreamStationLauncher:
         # Always update requirements in case they changed
         self._install_requirements()
         self._install_moondream_station()
+
+        # A failed prefetch is retried (and reported) by the backend step
+        wait([manifest_prefetch])
         self._install_backend_requirements(args)
 
     def launch(self, args: list[str]):
@@ -3,7 +3,7 @@ import shlex
 from typing import Dict, Callable
 from prompt_toolkit import prompt
 from prompt_toolkit.formatted_text import ANSI
-from rich.console import Console
+from rich import get_console
 from rich.panel import Panel
 from rich import print as rprint
 
@@ -24,7 +24,9 @@ from .session_manager import SessionManager
 
 class REPLSession:
     def __init__(self, manifest_source: str = None):
-        self.console = Console()
+        # Same Console that rich.print writes through, so output stays ordered
+        # and terminal detection runs once
+        self.console = get_console()
         self.manifest_source = manifest_source
         self.config = ConfigManager()
         self.manifest_manager = ManifestManager(self.config)
@@ -46,6 +48,7 @@ class REPLSession:
 
         # Command mappings
         self.command_map = self._init_commands()
+        self.slash_command_map = self._init_slash_commands()
 
         # Initialize tab completer after command_map is ready
         self.completer = TabCompleter(self)
@@ -54,8 +57,10 @@ class REPLSession:
         welcome_text = None
         if manifest_source:
             self._load_manifest(manifest_source)
-            # Reinitialize analytics now that manifest is loaded
-            self.analytics._initialize_posthog()
+            # Reinitialize analytics now that manifest is loaded; its Hugging
+            # Face probe runs alongside startup, and events tracked before it
+            # finishes are replayed once the client is ready
+            self.analytics.initialize_in_background()
             messages = self.manifest_manager.get_messages()
             welcome_text = messages.get("welcome")
 
@@ -85,13 +90,25 @@ class REPLSession:
             "man": self.commands.manual,
         }
 
+    def _init_slash_commands(self) -> Dict[str, Callable]:
+        """Initialize slash command mappings, aliases included"""
+        return {
+            "help": self.commands.help,
+            "h": self.commands.help,
+            "ls": self.commands.help,
+            "exit": self._exit,
+            "quit": self._exit,
+            "q": self._exit,
+            "clear": self.commands.clear,
+            "cls": self.commands.clear,
+            "settings": self.commands.settings,
+        }
+
     def _load_manifest(self, source: str):
         """Load manifest from source"""
         try:
             with self.display.spinner(f"Loading manifest from {source}"):
-                self.manifest_manager.load_manifest(
-                    source, self.analytics, self.display
-                )
+                self.manifest_manager.load_manifest(source, self.analytics)
 
             self.config.set("last_manifest_source", source)
 
@@ -207,7 +224,7 @@ class REPLSession:
                 self.display.show_update_available(
                     update_info.current_version, update_info.latest_version
                 )
-        except:
+        except Exception:
             pass
 
     def _show_manifest_messages(self):
@@ -232,7 +249,7 @@ class REPLSession:
 
             for msg in version_messages:
                 self.display.show_version_message(msg.message, msg.severity)
-        except:
+        except Exception:
             pass
 
     def _handle_input(self):
@@ -261,15 +278,9 @@ class REPLSession:
 
     def _handle_slash_command(self, command: str):
         """Handle slash commands like /help, /exit"""
-        cmd = command[1:].lower()
-        if cmd in ["help", "h", "ls"]:
-            self.commands.help([])
-        elif cmd in ["exit", "quit", "q"]:
-            self._exit([])
-        elif cmd in ["clear", "cls"]:
-            self.commands.clear([])
-        elif cmd == "settings":
-            self.commands.settings([])
+        handler = self.slash_command_map.get(command[1:].lower())
+        if handler:
+            handler([])
         else:
             self.display.error(f"Unknown slash command: {command}")
             rprint("[dim]Try /help for available commands[/dim]")
@@ -1,29 +1,31 @@
+import atexit
 import json
 import time
-from pathlib import Path
 from typing import Dict, Any
 from datetime import datetime
 
-from .core.config import SERVICE_PORT
+from .core.config import SERVICE_PORT, SESSION_FLUSH_INTERVAL, get_app_dir
 
 
 class SessionState:
     def __init__(self):
-        self.session_dir = Path.home() / ".moondream-station" / "sessions"
+        self.session_dir = get_app_dir() / "sessions"
         self.session_dir.mkdir(parents=True, exist_ok=True)
         self.session_file = self.session_dir / "current.json"
         self.history_file = self.session_dir / "history.json"
         self.state = self._load_session()
         self.command_history = self._load_history()
+        self._dirty = False
+        self._last_flush = time.monotonic()
+        atexit.register(self.flush)
 
     def _load_session(self) -> Dict[str, Any]:
         previous_session = {}
-        if self.session_file.exists():
-            try:
-                with open(self.session_file) as f:
-                    previous_session = json.load(f)
-            except (json.JSONDecodeError, IOError):
-                pass
+        try:
+            with open(self.session_file) as f:
+                previous_session = json.load(f)
+        except (json.JSONDecodeError, IOError):
+            pass
 
         # Always create a new session on app launch, but preserve some data
         return {
@@ -35,12 +37,11 @@ class SessionState:
         }
 
     def _load_history(self) -> list:
-        if self.history_file.exists():
-            try:
-                with open(self.history_file) as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
-                pass
+        try:
+            with open(self.history_file) as f:
+                return json.load(f)
+        except (json.JSONDecodeError, IOError):
+            pass
         return []
 
     def _save_session(self):
@@ -70,6 +71,17 @@ class SessionState:
         if len(self.command_history) > 1000:
             self.command_history = self.command_history[-1000:]
 
+        # Rewriting both files per request dominates under load; batch them
+        self._dirty = True
+        if time.monotonic() - self._last_flush >= SESSION_FLUSH_INTERVAL:
+            self.flush()
+
+    def flush(self):
+        """Write pending request history and session state to disk"""
+        if not self._dirty:
+            return
+        self._dirty = False
+        self._last_flush = time.monotonic()
         self._save_history()
         self._save_session()
 
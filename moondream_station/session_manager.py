@@ -1,9 +1,15 @@
+import select
+import sys
 import time
-import requests
 from typing import Dict, Any, Optional, List
 from rich.panel import Panel
 
-from moondream_station.core.config import SERVICE_PORT
+REFRESH_INTERVAL = 2.0
+PANEL_ROWS = 7  # Both session panels are padded to this height so they line up
+
+
+def _pad_rows(lines: List[str]) -> str:
+    return "\n".join(lines) + "\n" * (PANEL_ROWS - len(lines))
 
 
 class SessionManager:
@@ -37,19 +43,19 @@ class SessionManager:
         while True:
             try:
                 current_time = time.time()
-                if current_time - last_refresh >= 2.0:
+                if current_time - last_refresh >= REFRESH_INTERVAL:
                     refresh_display()
                     last_refresh = current_time
 
+                # Block until input arrives or the next refresh is due
+                wait = max(0.0, last_refresh + REFRESH_INTERVAL - time.time())
                 try:
-                    import select
-                    import sys
-
-                    if select.select([sys.stdin], [], [], 0.1)[0]:
+                    if select.select([sys.stdin], [], [], wait)[0]:
                         input()
                         break
-                except:
-                    pass
+                except (OSError, ValueError):
+                    # stdin isn't selectable (e.g. Windows); just wait it out
+                    time.sleep(wait)
 
             except KeyboardInterrupt:
                 break
@@ -69,23 +75,22 @@ class SessionManager:
             f"[bold]Duration:[/bold] {info['duration']}",
             f"[bold]Last Model:[/bold] {info['last_model'] or 'None'}",
             f"[bold]Last Port:[/bold] {info['last_port']}",
-            "",
-            "",
         ]
 
         session_panel = Panel(
-            "\n".join(session_content),
+            _pad_rows(session_content),
             title="[bold blue]Session Information[/bold blue]",
             border_style="blue",
             padding=(1, 2),
             width=34,
         )
 
-        if self.repl.service.is_running():
+        running = self.repl.service.is_running()
+        if running:
             stats = self._get_service_stats()
             if stats:
                 service_content = [
-                    f"[bold green]Status:[/bold green] Running",
+                    "[bold green]Status:[/bold green] Running",
                     f"[bold]Model:[/bold] {stats.get('model', 'Unknown')}",
                     f"[bold]Workers:[/bold] {stats.get('workers', 0)}",
                     f"[bold]Active Requests:[/bold] {stats.get('processing', 0)}",
@@ -95,29 +100,21 @@ class SessionManager:
                 ]
             else:
                 service_content = [
-                    f"[bold green]Status:[/bold green] Running",
+                    "[bold green]Status:[/bold green] Running",
                     f"[bold]Requests Processed:[/bold] {info['requests_processed']}",
                     "[yellow]Unable to fetch detailed stats[/yellow]",
-                    "",
-                    "",
-                    "",
-                    "",
                 ]
         else:
             service_content = [
-                f"[bold red]Status:[/bold red] Stopped",
+                "[bold red]Status:[/bold red] Stopped",
                 f"[bold]Requests Processed:[/bold] {info['requests_processed']}",
                 "[dim]Start service to see inference statistics[/dim]",
-                "",
-                "",
-                "",
-                "",
             ]
 
         service_panel = Panel(
-            "\n".join(service_content),
+            _pad_rows(service_content),
             title="[bold blue]Service Status[/bold blue]",
-            border_style="green" if self.repl.service.is_running() else "red",
+            border_style="green" if running else "red",
             padding=(1, 2),
             width=34,
         )
@@ -126,15 +123,17 @@ class SessionManager:
             from rich.columns import Columns
 
             return Columns([session_panel, service_panel], equal=True)
-        except:
+        except ImportError:
             from rich.console import Group
 
             return Group(session_panel, service_panel)
 
     def _get_service_stats(self) -> Optional[Dict[str, Any]]:
+        # The server runs in this process; read its stats without an HTTP hop
+        rest_server = self.repl.service.rest_server
+        if not rest_server:
+            return None
         try:
-            port = self.repl.config.get("service_port", SERVICE_PORT)
-            response = requests.get(f"http://localhost:{port}/v1/stats", timeout=2)
-            return response.json()
-        except:
+            return rest_server.get_stats()
+        except Exception:
             return None
@@ -1,21 +1,87 @@
 import contextlib
-import platform
 import random
 from packaging.version import Version
-from rich.console import Console
+from rich import get_console
 from rich.panel import Panel
 from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich import print as rprint
 
-from .. import __version__
-
-from ..core.models import ModelManager
+from ..core.config import get_current_os
+from ..core.models import INSTALLED_VERSION, ModelManager
+
+BANNER = "[bold blue]🌙 Moondream Station[/bold blue]\n[dim]Model hosting and management[/dim]"
+
+STARTUP_MESSAGES = (
+    "Firing up the jets",
+    "Prepping the flux capacitor",
+    "Loading quantum cores",
+    "Spinning up the neural networks",
+    "Awakening the AI overlords",
+    "Booting up the magic",
+    "Rolling out the red carpet",
+    "Synthesizing digital consciousness",
+    "Preparing the show",
+    "Launching into hyperspace",
+    "Charging the batteries",
+    "Calibrating the targeting systems",
+    "Fine-tuning the engines",
+    "Summoning the digital winds",
+    "Painting the canvas",
+    "Gazing into the crystal ball",
+    "Tuning the orchestra",
+    "Warming up the racing stripes",
+    "Setting up the circus",
+    "Chasing rainbows",
+)
+
+GOODBYE_MESSAGES = (
+    "Goodbye!",
+    "Until next time!",
+    "That's a wrap!",
+    "See you on the flip side!",
+    "The show must end... for now!",
+    "Over and out!",
+    "Powering down the matrix!",
+    "The crystal ball grows dim...",
+    "And that's the end of our song!",
+    "Crossing the finish line!",
+    "Sweet dreams, digital realm!",
+    "Putting away the brushes!",
+    "Tools down, mission complete!",
+    "Target acquired... goodbye!",
+    "Disappearing into the wind!",
+    "The circus leaves town!",
+    "Blasting off to infinity!",
+)
+
+STOPPING_MESSAGES = (
+    "Powering down the engines",
+    "Shutting down the neural networks",
+    "Closing the quantum gates",
+    "Dimming the crystal ball",
+    "Folding up the circus tent",
+    "Parking the starship",
+    "Turning off the magic",
+    "Disconnecting from the matrix",
+    "Putting the AI to sleep",
+    "Spinning down the cores",
+    "Closing the digital realm",
+    "Ending the performance",
+    "Switching off the lights",
+    "Deactivating the flux capacitor",
+    "Locking down the systems",
+    "Cooling the processors",
+    "Silencing the orchestra",
+    "Closing the portal",
+    "Wrapping up the show",
+    "Signing off from hyperspace",
+)
 
 
 class Display:
     def __init__(self):
-        self.console = Console()
+        self.console = get_console()
         self.panel_width = 70
 
     def success(self, message: str):
@@ -84,7 +150,7 @@ class Display:
 
         supported = {}
         unsupported = {}
-        current_os = platform.system().lower()
+        current_os = get_current_os()
 
         for name, model_info in models_info.items():
             # Check OS compatibility
@@ -97,10 +163,10 @@ class Display:
                 backend_info = manifest.backends[model_info.backend]
                 if backend_info.min_version:
                     try:
-                        if Version(__version__) < Version(backend_info.min_version):
+                        if INSTALLED_VERSION < Version(backend_info.min_version):
                             unsupported[name] = (model_info, backend_info.min_version)
                             continue
-                    except:
+                    except Exception:
                         pass
             supported[name] = model_info
 
@@ -189,10 +255,9 @@ class Display:
 
     def show_banner(self, welcome_text: str = None):
         """Display application banner with optional welcome message"""
-        banner_content = "[bold blue]🌙 Moondream Station[/bold blue]\n[dim]Model hosting and management[/dim]"
-
+        banner_content = BANNER
         if welcome_text:
-            banner_content += f"\n\n[green]{welcome_text}[/green]"
+            banner_content = f"{BANNER}\n\n[green]{welcome_text}[/green]"
 
         panel = Panel(
             banner_content, border_style="blue", padding=(0, 1), width=self.panel_width
@@ -235,75 +300,12 @@ class Display:
 
     def get_random_startup_message(self, model_name: str) -> str:
         """Get a random startup message for the model"""
-        messages = [
-            f"Firing up the jets: {model_name}",
-            f"Prepping the flux capacitor: {model_name}",
-            f"Loading quantum cores: {model_name}",
-            f"Spinning up the neural networks: {model_name}",
-            f"Awakening the AI overlords: {model_name}",
-            f"Booting up the magic: {model_name}",
-            f"Rolling out the red carpet: {model_name}",
-            f"Synthesizing digital consciousness: {model_name}",
-            f"Preparing the show: {model_name}",
-            f"Launching into hyperspace: {model_name}",
-            f"Charging the batteries: {model_name}",
-            f"Calibrating the targeting systems: {model_name}",
-            f"Fine-tuning the engines: {model_name}",
-            f"Summoning the digital winds: {model_name}",
-            f"Painting the canvas: {model_name}",
-            f"Gazing into the crystal ball: {model_name}",
-            f"Tuning the orchestra: {model_name}",
-            f"Warming up the racing stripes: {model_name}",
-            f"Setting up the circus: {model_name}",
-            f"Chasing rainbows: {model_name}",
-        ]
-        return random.choice(messages)
+        return f"{random.choice(STARTUP_MESSAGES)}: {model_name}"
 
     def get_random_goodbye_message(self) -> str:
         """Get a random goodbye message"""
-        messages = [
-            "Goodbye!",
-            "Until next time!",
-            "That's a wrap!",
-            "See you on the flip side!",
-            "The show must end... for now!",
-            "Over and out!",
-            "Powering down the matrix!",
-            "The crystal ball grows dim...",
-            "And that's the end of our song!",
-            "Crossing the finish line!",
-            "Sweet dreams, digital realm!",
-            "Putting away the brushes!",
-            "Tools down, mission complete!",
-            "Target acquired... goodbye!",
-            "Disappearing into the wind!",
-            "The circus leaves town!",
-            "Blasting off to infinity!",
-        ]
-        return f"[bold blue]{random.choice(messages)}[/bold blue]"
+        return f"[bold blue]{random.choice(GOODBYE_MESSAGES)}[/bold blue]"
 
     def get_random_stopping_message(self) -> str:
         """Get a random service stopping message"""
-        messages = [
-            "Powering down the engines",
-            "Shutting down the neural networks",
-            "Closing the quantum gates",
-            "Dimming the crystal ball",
-            "Folding up the circus tent",
-            "Parking the starship",
-            "Turning off the magic",
-            "Disconnecting from the matrix",
-            "Putting the AI to sleep",
-            "Spinning down the cores",
-            "Closing the digital realm",
-            "Ending the performance",
-            "Switching off the lights",
-            "Deactivating the flux capacitor",
-            "Locking down the systems",
-            "Cooling the processors",
-            "Silencing the orchestra",
-            "Closing the portal",
-            "Wrapping up the show",
-            "Signing off from hyperspace",
-        ]
-        return random.choice(messages)
+        return random.choice(STOPPING_MESSAGES)
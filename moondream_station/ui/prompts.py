@@ -2,7 +2,7 @@ import typer
 from typing import List
 from rich.prompt import Prompt
 from rich.table import Table
-from rich.console import Console
+from rich import get_console
 from prompt_toolkit import prompt
 from prompt_toolkit.formatted_text import ANSI
 
@@ -11,7 +11,7 @@ from ..core.updater import UpdateInfo
 
 class Prompts:
     def __init__(self):
-        self.console = Console()
+        self.console = get_console()
 
     def confirm(self, message: str, default: bool = False) -> bool:
         """Show confirmation prompt with proper backspace handling"""